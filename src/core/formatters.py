@@ -4,9 +4,18 @@ Módulo de formatação de dados.
 Contém funções utilitárias para formatação de valores monetários, datas e outros dados.
 """
 
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
+# Remove espaços e separadores de milhar em uma passagem; o símbolo "R$" é
+# retirado antes, como token, para não apagar "R" ou "$" soltos no texto
+_LIMPEZA_VALOR = str.maketrans("", "", " .")
+
+# Compartilhada pelos módulos que extraem apenas os dígitos de um texto
+RE_NAO_DIGITO = re.compile(r"\D")
+
 
 def normalizar_nome_cliente(valor: str) -> str:
     """Remove espaços excedentes e padroniza cliente em caixa alta."""
@@ -18,7 +27,7 @@ def normalizar_nome_cliente(valor: str) -> str:
 
 def normalizar_valor_padrao_brasileiro(valor: str) -> str:
     """Normaliza texto numérico para o formato monetário brasileiro simples."""
-    digitos = "".join(ch for ch in valor if ch.isdigit())
+    digitos = RE_NAO_DIGITO.sub("", valor)
     if not digitos:
         return ""
 
@@ -28,18 +37,26 @@ def normalizar_valor_padrao_brasileiro(valor: str) -> str:
     return f"{parte_inteira_formatada},{centavos}"
 
 
+def converter_valor_monetario(valor: str) -> float:
+    """Converte texto monetário brasileiro (ex.: ``"R$ 1.234,56"``) em float.
+
+    Levanta ``ValueError`` quando o texto não representa um número.
+    """
+    return float(
+        valor.replace("R$", "").translate(_LIMPEZA_VALOR).replace(",", ".")
+    )
+
+
+@lru_cache(maxsize=4096)
 def formatar_valor_monetario(valor: float | str) -> str:
-    """Formata valor monetário com separador de milhares e vírgula decimal."""
+    """Formata valor monetário com separador de milhares e vírgula decimal.
+
+    Resultados são cacheados: a tabela reformata os mesmos valores a cada
+    atualização dos filtros.
+    """
     try:
         if isinstance(valor, str):
-            # Limpar valor se for string
-            valor_limpo = (
-                valor.replace("R$", "")
-                .replace(" ", "")
-                .replace(".", "")
-                .replace(",", ".")
-            )
-            valor = float(valor_limpo)
+            valor = converter_valor_monetario(valor)
 
         # Formatar com separador de milhares (ponto) e decimais (vírgula)
         valor_formatado = (
@@ -81,8 +98,12 @@ def converter_data_para_banco(data_str: Optional[str]) -> str:
         return str(data_str)
 
 
+@lru_cache(maxsize=8192)
 def formatar_data_para_exibicao(data_str: str) -> str:
-    """Convert data from YYYY-MM-DD format to DD/MM/YYYY for display."""
+    """Convert data from YYYY-MM-DD format to DD/MM/YYYY for display.
+
+    Resultados são cacheados, pois as mesmas datas se repetem entre linhas.
+    """
     if not data_str:
         return ""
 
@@ -5,7 +5,8 @@ Contém funções para calcular períodos de faturamento e aplicar
 filtros baseados nas regras da empresa.
 """
 
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 
 
 def _calcular_periodo_faturamento_base(data: datetime):
@@ -98,9 +99,12 @@ def calcular_periodo_faturamento_para_data(data: datetime):
     return mes_formatado, ano_formatado
 
 
-def calcular_periodo_faturamento_para_data_datas(data: datetime):
+@lru_cache(maxsize=1024)
+def calcular_periodo_faturamento_para_data_datas(data: date):
     """Calcula período de faturamento para uma data específica.
 
+    Aceita ``date`` ou ``datetime`` (só dia, mês e ano são usados); passe
+    ``date`` para que chamadas do mesmo dia reaproveitem o cache.
     Retorna objetos datetime para facilitar manipulação.
     """
     mes_faturamento, ano_faturamento = _calcular_periodo_faturamento_base(data)
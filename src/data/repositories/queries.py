@@ -171,25 +171,23 @@ def _buscar_registros_em_session(
     if offset is not None:
         stmt = stmt.offset(offset)
 
-    resultados = session.execute(stmt).all()
-    dados = []
-    for row in resultados:
-        dados.append(
-            (
-                encode_registro_id(slug, row[0]),
-                row[1],  # usuario
-                row[2],  # cliente
-                row[3],  # pedido
-                row[4],  # qtde_itens
-                row[5].isoformat(),  # data_entrada
-                row[6].isoformat() if row[6] else None,  # data_processo
-                row[7],  # tempo_corte
-                row[8],  # observacoes
-                float(row[9]),  # valor_pedido
-                format_datetime(row[10]),  # data_lancamento
-            )
+    # Tuplas simples (sem dicts/ORM) montadas em uma única compreensão
+    return [
+        (
+            encode_registro_id(slug, row[0]),
+            row[1],  # usuario
+            row[2],  # cliente
+            row[3],  # pedido
+            row[4],  # qtde_itens
+            row[5].isoformat(),  # data_entrada
+            row[6].isoformat() if row[6] else None,  # data_processo
+            row[7],  # tempo_corte
+            row[8],  # observacoes
+            float(row[9]),  # valor_pedido
+            format_datetime(row[10]),  # data_lancamento
         )
-    return dados
+        for row in session.execute(stmt).all()
+    ]
 
 
 # pylint: disable=R0917,R0914
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Dict, Iterator, Optional, Tuple, TypeVar
@@ -19,6 +20,9 @@ from src.data.models import SharedBase, UserBase, UsuarioModel
 logger = logging.getLogger(__name__)
 
 _user_sessionmakers: Dict[Path, sessionmaker[Session]] = {}
+# Consultas da interface rodam em threads do pool: a criação de engines
+# (create_all e ALTER TABLE de schema) não pode ser executada em paralelo.
+_engines_lock = threading.RLock()
 
 T = TypeVar("T")
 
@@ -91,7 +95,9 @@ def _shared_engine_cached() -> Engine:
 
 def get_shared_engine() -> Engine:
     """Retorna (lazy) o engine do banco compartilhado."""
-    return _shared_engine_cached()
+    # lru_cache não impede que duas threads executem a criação ao mesmo tempo
+    with _engines_lock:
+        return _shared_engine_cached()
 
 
 @lru_cache(maxsize=1)
@@ -162,14 +168,15 @@ def _ensure_usuario_schema(engine: Engine) -> None:
 
 def _get_user_sessionmaker(slug: str) -> sessionmaker[Session]:
     path = user_db_path(slug=slug)
-    if path not in _user_sessionmakers:
-        engine = _criar_engine_sqlite(path)
-        UserBase.metadata.create_all(engine)
-        _ensure_registro_schema(engine)
-        _user_sessionmakers[path] = sessionmaker(
-            bind=engine, expire_on_commit=False, future=True
-        )
-    return _user_sessionmakers[path]
+    with _engines_lock:
+        if path not in _user_sessionmakers:
+            engine = _criar_engine_sqlite(path)
+            UserBase.metadata.create_all(engine)
+            _ensure_registro_schema(engine)
+            _user_sessionmakers[path] = sessionmaker(
+                bind=engine, expire_on_commit=False, future=True
+            )
+        return _user_sessionmakers[path]
 
 
 def get_sessionmaker_for_slug(slug: str) -> sessionmaker[Session]:
@@ -228,7 +235,8 @@ def remover_banco_usuario(usuario: str) -> bool:
     path = user_db_path(usuario=usuario)
 
     # Remove o sessionmaker do cache e fecha o engine associado
-    sessionmaker_removido = _user_sessionmakers.pop(path, None)
+    with _engines_lock:
+        sessionmaker_removido = _user_sessionmakers.pop(path, None)
     if sessionmaker_removido:
         # Fecha o engine associado ao sessionmaker
         engine = sessionmaker_removido.kw.get("bind")
@@ -14,7 +14,8 @@ Funcionalidades:
 
 import logging
 import sys
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtCore import QDate
@@ -266,8 +267,13 @@ def obter_data_atual_utc():
     da data UTC, permitindo que usuários em fusos horários negativos
     (como UTC-3) possam registrar processos na data correta.
     """
-    data_utc = datetime.now(timezone.utc).date()
-    return QDate(data_utc.year, data_utc.month, data_utc.day)
+    return _qdate_do_dia(datetime.now(timezone.utc).date())
+
+
+@lru_cache(maxsize=1)
+def _qdate_do_dia(dia: date) -> QDate:
+    """Constrói o QDate de ``dia`` uma vez; chamadas no mesmo dia reutilizam."""
+    return QDate(dia.year, dia.month, dia.day)
 
 
 # Constantes para dashboard e gráficos
@@ -33,25 +33,22 @@ class AutocompleteManager:
         self._filter_entry = entry
         self._aplicar_completer(entry)
 
-    def refresh_form(self) -> None:
-        """Atualiza as sugestões do autocompletar do formulário."""
-        if self._form_entry is None:
-            return
-        self._aplicar_completer(self._form_entry)
-
-    def refresh_filter(self) -> None:
-        """Atualiza as sugestões do autocompletar do filtro."""
-        if self._filter_entry is None:
-            return
-        self._aplicar_completer(self._filter_entry)
-
-    def refresh_all(self) -> None:
-        """Atualiza todos os autocompletes configurados."""
-        self.refresh_form()
-        self.refresh_filter()
-
-    def _aplicar_completer(self, entry: QLineEdit) -> None:
-        clientes = list(self._carregar_clientes())
+    def aplicar_clientes(self, clientes: Iterable[str]) -> None:
+        """Atualiza todos os autocompletes com uma lista já carregada.
+
+        Permite buscar os clientes fora da thread da interface e reaproveitar
+        a mesma lista nos dois campos.
+        """
+        clientes = list(clientes)
+        for entry in (self._form_entry, self._filter_entry):
+            if entry is not None:
+                self._aplicar_completer(entry, clientes)
+
+    def _aplicar_completer(
+        self, entry: QLineEdit, clientes: list[str] | None = None
+    ) -> None:
+        if clientes is None:
+            clientes = list(self._carregar_clientes())
         completer = QCompleter(clientes, self._parent)
         completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         completer.setFilterMode(Qt.MatchFlag.MatchStartsWith)
@@ -5,12 +5,14 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Sequence
 
 from sqlalchemy.exc import SQLAlchemyError
 
 from src import data as db
-from src.core.formatters import normalizar_nome_cliente
+from src.core.formatters import RE_NAO_DIGITO, normalizar_nome_cliente
 from src.core.periodo_faturamento import \
     calcular_periodo_faturamento_atual_datas
 
@@ -21,11 +23,16 @@ __all__ = [
     "listar_periodos_do_ano",
     "buscar_registros_filtrados",
     "obter_estatisticas_totais",
+    "buscar_registros_com_estatisticas",
+    "invalidar_cache",
+    "carregar_dados_iniciais",
 ]
 
 
 logger = logging.getLogger(__name__)
 
+_PRIMEIRO = itemgetter(0)
+
 
 @dataclass
 class EstatisticasTotais:
@@ -50,12 +57,13 @@ def carregar_clientes_upper() -> List[str]:
     except (SQLAlchemyError, RuntimeError, AttributeError, TypeError) as exc:
         logger.exception("Erro ao carregar clientes: %s", exc)
         return []
-    clientes_normalizados = {
-        normalizar_nome_cliente(cliente)
-        for cliente in clientes_raw
-        if normalizar_nome_cliente(cliente)
-    }
-    return sorted(clientes_normalizados)
+    # Normaliza cada cliente uma única vez; filter(None) descarta vazios.
+    return sorted(set(filter(None, map(normalizar_nome_cliente, clientes_raw))))
+
+
+def _ano_atual() -> str:
+    _, data_fim_atual = calcular_periodo_faturamento_atual_datas()
+    return str(data_fim_atual.year)
 
 
 def listar_anos_disponiveis(usuario_filtro: Optional[str]) -> List[str]:
@@ -73,8 +81,7 @@ def listar_anos_disponiveis(usuario_filtro: Optional[str]) -> List[str]:
         logger.exception("Erro ao buscar anos únicos: %s", exc)
         anos = []
 
-    _, data_fim_atual = calcular_periodo_faturamento_atual_datas()
-    ano_atual = str(data_fim_atual.year)
+    ano_atual = _ano_atual()
     if ano_atual not in anos:
         anos.append(ano_atual)
 
@@ -103,53 +110,66 @@ def listar_periodos_do_ano(
         logger.exception("Erro ao buscar períodos de faturamento: %s", exc)
         return []
 
-    _, data_fim_atual = calcular_periodo_faturamento_atual_datas()
-    ano_atual = str(data_fim_atual.year)
-
-    if ano == ano_atual:
+    if ano == _ano_atual():
         db.garantir_periodo_atual(periodos)
 
     return periodos
 
 
-def _ordenacao_chave(registro: Sequence[Any]) -> tuple[datetime, datetime]:
-    """Chave de ordenação utilizada para ordenar registros."""
+def invalidar_cache() -> None:
+    """Descarta os caches de consulta do repositório.
 
-    data_processo = registro[6]
-    data_entrada = registro[5]
-    data_lancamento = registro[10]
+    As listas acima são derivadas diretamente dessas consultas (já em
+    cache), então esta é a única camada a invalidar.
+    """
 
-    try:
-        if data_lancamento:
-            if "T" in str(data_lancamento):
-                timestamp_obj = datetime.fromisoformat(
-                    str(data_lancamento).replace("Z", "")
-                )
-            else:
-                timestamp_obj = datetime.strptime(
-                    str(data_lancamento), "%Y-%m-%d %H:%M:%S"
-                )
-        else:
-            timestamp_obj = datetime.min
-    except (ValueError, AttributeError) as exc:
-        logger.exception(
-            "Erro ao converter timestamp '%s': %s",
-            data_lancamento,
-            exc,
-        )
-        timestamp_obj = datetime.min
+    db.limpar_caches_consultas()
 
-    # Usar data_processo se existir, senão data_entrada
-    data_para_ordenacao = data_processo or data_entrada
 
-    if not data_para_ordenacao:
-        return (datetime.min, timestamp_obj)
+def carregar_dados_iniciais(
+    usuario_filtro: Optional[str],
+    *,
+    incluir_usuarios: bool,
+) -> List[str]:
+    """Busca os usuários (admin) e pré-carrega anos e períodos do ano corrente.
 
-    try:
-        data_obj = datetime.strptime(str(data_para_ordenacao), "%Y-%m-%d")
-        return (data_obj, timestamp_obj)
-    except ValueError:
-        return (datetime.min, timestamp_obj)
+    Pensada para rodar fora da thread da interface na abertura do widget:
+    a configuração dos filtros que vem em seguida encontra os dados em cache.
+    """
+
+    usuarios = db.buscar_usuarios_unicos() if incluir_usuarios else []
+    listar_anos_disponiveis(usuario_filtro)
+    listar_periodos_do_ano(_ano_atual(), usuario_filtro)
+    return usuarios
+
+
+def _digitos_data(valor: Any, tamanho: int) -> int:
+    """Converte uma data/timestamp ISO em inteiro ``AAAAMMDD[HHMMSS]``.
+
+    Retorna 0 (antes de qualquer data válida) quando o valor está ausente
+    ou não contém dígitos suficientes.
+    """
+
+    if not valor:
+        return 0
+    digitos = RE_NAO_DIGITO.sub("", str(valor))[:tamanho]
+    if len(digitos) < 8:
+        return 0
+    return int(digitos.ljust(tamanho, "0"))
+
+
+@lru_cache(maxsize=4096)
+def _timestamp_para_chave(data_lancamento: Any) -> int:
+    """Converte o timestamp de lançamento, registrando valores inválidos.
+
+    Memoizado por valor: um timestamp malformado é convertido e registrado
+    no log uma única vez, não a cada registro ou ordenação.
+    """
+
+    timestamp = _digitos_data(data_lancamento, 14)
+    if data_lancamento and not timestamp and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Erro ao converter timestamp %r", data_lancamento)
+    return timestamp
 
 
 def buscar_registros_filtrados(
@@ -187,9 +207,20 @@ def buscar_registros_filtrados(
     # Se estiver filtrando por um usuário específico, o banco já retorna ordenado
     # via ORDER BY COALESCE(data_processo, data_entrada)
     if usuario:
-        return list(registros)
-
-    return sorted(registros, key=_ordenacao_chave)
+        return registros
+
+    # Decora cada registro com uma chave inteira: data (processo ou entrada)
+    # AAAAMMDD seguida do timestamp de lançamento AAAAMMDDHHMMSS.
+    decorados = [
+        (
+            _digitos_data(registro[6] or registro[5], 8) * 10**14
+            + _timestamp_para_chave(registro[10]),
+            registro,
+        )
+        for registro in registros
+    ]
+    decorados.sort(key=_PRIMEIRO)
+    return [registro for _, registro in decorados]
 
 
 def _parse_data(valor: Any) -> date | None:
@@ -201,25 +232,62 @@ def _parse_data(valor: Any) -> date | None:
         return None
 
 
+@dataclass
+class _ColunasRegistros:
+    """Colunas dos registros já convertidas, em layout por coluna (SoA).
+
+    Cada campo é convertido uma única vez e reaproveitado por todas as
+    métricas do painel, em vez de cada cálculo refazer o parse linha a linha.
+    """
+
+    qtdes: List[int]
+    valores: List[float]
+    datas_entrada: List[date | None]
+    datas_processo: List[date | None]
+    segundos_corte: List[int]
+
+
+def _tempo_para_segundos(tempo_corte: Any) -> int:
+    if not tempo_corte:
+        return 0
+
+    partes = tempo_corte.split(":")
+    if len(partes) != 3:
+        return 0
+    try:
+        horas, minutos, segundos = (int(p) for p in partes)
+    except ValueError:
+        return 0
+
+    return horas * 3600 + minutos * 60 + segundos
+
+
+def _extrair_colunas(registros: Sequence[Sequence[Any]]) -> _ColunasRegistros:
+    """Converte os registros (índices de buscar_lancamentos_filtros_completos)."""
+
+    return _ColunasRegistros(
+        qtdes=[int(registro[4] or 0) for registro in registros],
+        valores=[float(registro[9] or 0) for registro in registros],
+        datas_entrada=[_parse_data(registro[5]) for registro in registros],
+        datas_processo=[_parse_data(registro[6]) for registro in registros],
+        segundos_corte=[_tempo_para_segundos(registro[7])
+                        for registro in registros],
+    )
+
+
 def _obter_limites_periodo(
     filtros: Dict[str, Any],
-    registros: Sequence[Sequence[Any]],
+    colunas: _ColunasRegistros,
 ) -> tuple[date | None, date | None]:
     inicio = _parse_data(filtros.get("data_inicio"))
     fim = _parse_data(filtros.get("data_fim"))
 
     if inicio is None:
-        datas_inicio = [_parse_data(reg[5]) for reg in registros]
-        datas_inicio = [data for data in datas_inicio if data is not None]
-        if datas_inicio:
-            inicio = min(datas_inicio)
+        inicio = min(filter(None, colunas.datas_entrada), default=None)
 
     if fim is None:
-        datas_fim = [_parse_data(reg[6]) for reg in registros]
-        datas_fim = [data for data in datas_fim if data is not None]
-        if datas_fim:
-            fim = max(datas_fim)
-        elif inicio is not None:
+        fim = max(filter(None, colunas.datas_processo), default=None)
+        if fim is None and inicio is not None:
             fim = inicio
 
     return inicio, fim
@@ -239,12 +307,12 @@ def _dias_uteis_entre(inicio: date | None, fim: date | None) -> int:
 
 
 def _calcular_media_dias_processo(
-    registros: Sequence[Sequence[Any]],
+    colunas: _ColunasRegistros,
 ) -> float | None:
     diferencas: list[int] = []
-    for registro in registros:
-        data_entrada = _parse_data(registro[5])
-        data_processo = _parse_data(registro[6])
+    for data_entrada, data_processo in zip(
+        colunas.datas_entrada, colunas.datas_processo
+    ):
         if data_entrada is None or data_processo is None:
             continue
         delta = (data_processo - data_entrada).days
@@ -275,32 +343,16 @@ def _calcular_estimativa_itens_mes(
 
 
 def _somar_tempo_processado_no_dia(
-    registros: Sequence[Sequence[Any]],
+    colunas: _ColunasRegistros,
     referencia: date,
 ) -> int:
-    total_segundos = 0
-    referencia_str = referencia.strftime("%Y-%m-%d")
-
-    for registro in registros:
-        data_processo = registro[6]
-        tempo_corte = registro[7]
-
-        if not data_processo or data_processo != referencia_str:
-            continue
-        if not tempo_corte:
-            continue
-
-        partes = tempo_corte.split(":")
-        if len(partes) != 3:
-            continue
-        try:
-            horas, minutos, segundos = (int(p) for p in partes)
-        except ValueError:
-            continue
-
-        total_segundos += horas * 3600 + minutos * 60 + segundos
-
-    return total_segundos
+    return sum(
+        segundos
+        for data_processo, segundos in zip(
+            colunas.datas_processo, colunas.segundos_corte
+        )
+        if data_processo == referencia
+    )
 
 
 def _formatar_segundos_para_horas(total_segundos: int) -> str | None:
@@ -319,31 +371,15 @@ def _formatar_segundos_para_horas(total_segundos: int) -> str | None:
 
 
 def _calcular_metricas_tempo_dashboard(
-    registros: Sequence[Sequence[Any]],
+    colunas: _ColunasRegistros,
 ) -> tuple[int, int]:
     """Calcula total de segundos e dias únicos com apontamento (lógica dashboard)."""
     total_segundos = 0
-    dias_com_apontamento: set[str] = set()
-
-    for registro in registros:
-        # Indices baseados em buscar_lancamentos_filtros_completos
-        data_entrada = registro[5]
-        data_processo = registro[6]
-        tempo_corte = registro[7]
-
-        if not tempo_corte:
-            continue
-
-        partes = tempo_corte.split(":")
-        if len(partes) != 3:
-            continue
-        try:
-            horas, minutos, segundos = (int(p) for p in partes)
-        except ValueError:
-            continue
-
-        segundos_reg = horas * 3600 + minutos * 60 + segundos
+    dias_com_apontamento: set[date] = set()
 
+    for data_entrada, data_processo, segundos_reg in zip(
+        colunas.datas_entrada, colunas.datas_processo, colunas.segundos_corte
+    ):
         # Só conta para a média se houver tempo apontado
         if segundos_reg > 0:
             total_segundos += segundos_reg
@@ -351,34 +387,46 @@ def _calcular_metricas_tempo_dashboard(
             # Determina o dia do apontamento (Processo ou Entrada)
             data_base = data_processo or data_entrada
             if data_base:
-                dias_com_apontamento.add(str(data_base))
+                dias_com_apontamento.add(data_base)
 
     return total_segundos, len(dias_com_apontamento)
 
 
+def _somar_totais(colunas: _ColunasRegistros) -> Dict[str, Any]:
+    """Calcula pedidos, itens e valor a partir das colunas já convertidas."""
+
+    return {
+        "total_pedidos": len(colunas.qtdes),
+        "total_itens": sum(colunas.qtdes),
+        "total_valor": sum(colunas.valores),
+    }
+
+
 def obter_estatisticas_totais(
     filtros: Optional[Dict[str, Any]] = None,
+    registros: Optional[Sequence[Sequence[Any]]] = None,
 ) -> EstatisticasTotais:
-    """Obtém os totais agregados e métricas derivadas para o painel."""
+    """Obtém os totais agregados e métricas derivadas para o painel.
+
+    Quando ``registros`` já foram buscados com os mesmos filtros, os totais
+    são calculados a partir deles, sem novas consultas ao banco. Caso
+    contrário, uma única busca filtrada alimenta totais e métricas.
+    """
 
     filtros = filtros or {}
 
     try:
-        registros = buscar_registros_filtrados(
-            usuario=filtros.get("usuario"),
-            cliente=filtros.get("cliente"),
-            pedido=filtros.get("pedido"),
-            data_inicio=filtros.get("data_inicio"),
-            data_fim=filtros.get("data_fim"),
-        )
-
-        totais = db.buscar_estatisticas_completas(
-            usuario=filtros.get("usuario"),
-            cliente=filtros.get("cliente"),
-            pedido=filtros.get("pedido"),
-            data_inicio=filtros.get("data_inicio"),
-            data_fim=filtros.get("data_fim"),
-        )
+        if registros is None:
+            registros = buscar_registros_filtrados(
+                usuario=filtros.get("usuario"),
+                cliente=filtros.get("cliente"),
+                pedido=filtros.get("pedido"),
+                data_inicio=filtros.get("data_inicio"),
+                data_fim=filtros.get("data_fim"),
+            )
+
+        colunas = _extrair_colunas(registros)
+        totais = _somar_totais(colunas)
     except (
         SQLAlchemyError,
         RuntimeError,
@@ -389,7 +437,7 @@ def obter_estatisticas_totais(
         logger.exception("Erro ao buscar estatísticas: %s", exc)
         return EstatisticasTotais(0, 0, 0.0, None, None, None, None, None, None)
 
-    periodo_inicio, periodo_fim = _obter_limites_periodo(filtros, registros)
+    periodo_inicio, periodo_fim = _obter_limites_periodo(filtros, colunas)
 
     fim_para_media = date.today()
     if periodo_fim is not None:
@@ -398,19 +446,19 @@ def obter_estatisticas_totais(
     dias_uteis_decorridos = _dias_uteis_entre(periodo_inicio, fim_para_media)
     dias_uteis_periodo = _dias_uteis_entre(periodo_inicio, periodo_fim)
 
-    media_dias = _calcular_media_dias_processo(registros)
+    media_dias = _calcular_media_dias_processo(colunas)
     media_por_dia = _calcular_media_itens_por_dia(
         int(totais.get("total_itens", 0)),
         dias_uteis_decorridos,
     )
     total_segundos_dia = _somar_tempo_processado_no_dia(
-        registros,
+        colunas,
         date.today(),
     )
     tempo_corte_dia = _formatar_segundos_para_horas(total_segundos_dia)
 
     total_segundos_total, dias_com_horas = _calcular_metricas_tempo_dashboard(
-        registros)
+        colunas)
     tempo_corte_total = _formatar_segundos_para_horas(total_segundos_total)
 
     media_tempo_corte_dia = None
@@ -436,3 +484,16 @@ def obter_estatisticas_totais(
         media_tempo_corte_dia=media_tempo_corte_dia,
         tempo_corte_dia=tempo_corte_dia,
     )
+
+
+def buscar_registros_com_estatisticas(
+    **filtros: Any,
+) -> tuple[List[Sequence[Any]], EstatisticasTotais]:
+    """Busca os registros filtrados e calcula os totais a partir deles.
+
+    Reúne as duas etapas para que possam rodar juntas fora da thread da
+    interface; os totais não exigem consulta adicional ao banco.
+    """
+
+    registros = buscar_registros_filtrados(**filtros)
+    return registros, obter_estatisticas_totais(filtros, registros)
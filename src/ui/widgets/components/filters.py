@@ -32,16 +32,14 @@ class FiltroControls:
     combo_ano: QComboBox
     combo_periodo: QComboBox
     btn_limpar: QPushButton
-    timer_cliente: QTimer
-    timer_pedido: QTimer
+    timer_texto: QTimer
 
 
 def criar_filtros(
     *,
     parent,
     is_admin: bool,
-    on_cliente_timeout: Callable[[], None],
-    on_pedido_timeout: Callable[[], None],
+    on_texto_timeout: Callable[[], None],
     on_ano_changed: Callable[[str], None],
     on_periodo_changed: Callable[[str], None],
     on_usuario_changed: Callable[[str], None],
@@ -74,11 +72,14 @@ def criar_filtros(
         """Filtrar registros pelo prefixo do nome do cliente.
 O filtro é aplicado automaticamente."""
     )
-    timer_cliente = QTimer(frame)
-    timer_cliente.setSingleShot(True)
-    timer_cliente.timeout.connect(on_cliente_timeout)
-
-    entry_cliente.textChanged.connect(lambda _: timer_cliente.start(500))
+    # Um único timer para cliente e pedido: digitar em qualquer um dos dois
+    # campos reinicia a mesma espera e dispara uma só consulta.
+    timer_texto = QTimer(frame)
+    timer_texto.setSingleShot(True)
+    timer_texto.setInterval(500)
+    timer_texto.timeout.connect(on_texto_timeout)
+
+    entry_cliente.textChanged.connect(lambda _: timer_texto.start())
     coluna_cliente, peso_cliente = criar_coluna_rotulo(
         "Cliente:", entry_cliente, 3)
     layout.addLayout(coluna_cliente, peso_cliente)
@@ -90,11 +91,7 @@ O filtro é aplicado automaticamente."""
         "Pedido:", entry_pedido, 3)
     layout.addLayout(coluna_pedido, peso_pedido)
 
-    timer_pedido = QTimer(frame)
-    timer_pedido.setSingleShot(True)
-    timer_pedido.timeout.connect(on_pedido_timeout)
-
-    entry_pedido.textChanged.connect(lambda _: timer_pedido.start(500))
+    entry_pedido.textChanged.connect(lambda _: timer_texto.start())
 
     combo_ano = NavigableComboBox(frame)
     combo_ano.addItem("Todos os anos")
@@ -157,6 +154,5 @@ O filtro é aplicado automaticamente."""
         combo_ano=combo_ano,
         combo_periodo=combo_periodo,
         btn_limpar=btn_limpar,
-        timer_cliente=timer_cliente,
-        timer_pedido=timer_pedido,
+        timer_texto=timer_texto,
     )
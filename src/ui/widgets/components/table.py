@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import Callable, List, Sequence
 
 from PySide6.QtCore import Qt, QTimer
@@ -18,7 +19,28 @@ from src.ui.styles import (aplicar_estilo_botao,
                            aplicar_estilo_botao_desabilitado,
                            obter_estilo_table_widget)
 
-__all__ = ["TabelaControls", "criar_tabela", "preencher_tabela"]
+__all__ = ["Coluna", "TabelaControls", "criar_tabela", "preencher_tabela"]
+
+_ALINHAMENTO_CENTRO = Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
+_ALINHAMENTO_DIREITA = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+_NAO_EDITAVEL = ~Qt.ItemFlag.ItemIsEditable
+
+
+class Coluna(IntEnum):
+    """Colunas da tabela de pedidos.
+
+    Índices sem a coluna "Usuário", que o administrador vê na posição 0;
+    nesse caso todas as demais são deslocadas em uma posição.
+    """
+
+    CLIENTE = 0
+    PEDIDO = 1
+    QTDE = 2
+    DATA_ENTRADA = 3
+    DATA_PROCESSO = 4
+    TEMPO_CORTE = 5
+    OBSERVACOES = 6
+    VALOR = 7
 
 
 @dataclass
@@ -70,7 +92,7 @@ def criar_tabela(
 
     tabela = QTableWidget(frame)
     tabela.setStyleSheet(obter_estilo_table_widget())
-    colunas = _definir_colunas(tabela, is_admin)
+    _definir_colunas(tabela, is_admin)
 
     tabela.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
     tabela.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
@@ -109,58 +131,22 @@ def criar_tabela(
 
     offset = 1 if is_admin else 0
 
-    pedido_col_index = 1 + offset
-    pedido_header_item = QTableWidgetItem("Pedido")
-    pedido_header_item.setTextAlignment(
-        Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
-    )
-    tabela.setHorizontalHeaderItem(pedido_col_index, pedido_header_item)
-
-    qtd_col_index = 2 + offset
-    qtd_header_item = QTableWidgetItem("Itens")
-    qtd_header_item.setTextAlignment(
-        Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
-    )
-    tabela.setHorizontalHeaderItem(qtd_col_index, qtd_header_item)
-
-    data_entrada_col_index = 3 + offset
-    data_entrada_header_item = QTableWidgetItem("Data Entrada")
-    data_entrada_header_item.setTextAlignment(
-        Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
-    )
-    tabela.setHorizontalHeaderItem(
-        data_entrada_col_index, data_entrada_header_item)
-
-    data_processo_col_index = 4 + offset
-    data_processo_header_item = QTableWidgetItem("Data Processo")
-    data_processo_header_item.setTextAlignment(
-        Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
-    )
-    tabela.setHorizontalHeaderItem(
-        data_processo_col_index, data_processo_header_item)
-
-    tempo_corte_col_index = 5 + offset
-    tempo_corte_header_item = QTableWidgetItem("Tempo Corte")
-    tempo_corte_header_item.setTextAlignment(
-        Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
-    )
-    tabela.setHorizontalHeaderItem(
-        tempo_corte_col_index, tempo_corte_header_item)
-
-    valor_col_index = len(colunas) - 1
-    valor_header_item = QTableWidgetItem("Valor (R$)")
-    valor_header_item.setTextAlignment(
-        Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+    cabecalhos_alinhados = (
+        (Coluna.PEDIDO, "Pedido", _ALINHAMENTO_CENTRO),
+        (Coluna.QTDE, "Itens", _ALINHAMENTO_CENTRO),
+        (Coluna.DATA_ENTRADA, "Data Entrada", _ALINHAMENTO_CENTRO),
+        (Coluna.DATA_PROCESSO, "Data Processo", _ALINHAMENTO_CENTRO),
+        (Coluna.TEMPO_CORTE, "Tempo Corte", _ALINHAMENTO_CENTRO),
+        (Coluna.VALOR, "Valor (R$)", _ALINHAMENTO_DIREITA),
     )
-    tabela.setHorizontalHeaderItem(valor_col_index, valor_header_item)
+    for coluna, titulo, alinhamento in cabecalhos_alinhados:
+        header_item = QTableWidgetItem(titulo)
+        header_item.setTextAlignment(alinhamento)
+        tabela.setHorizontalHeaderItem(offset + coluna, header_item)
 
     date_delegate = DateEditDelegate(tabela)
-    if is_admin:
-        tabela.setItemDelegateForColumn(4, date_delegate)
-        tabela.setItemDelegateForColumn(5, date_delegate)
-    else:
-        tabela.setItemDelegateForColumn(3, date_delegate)
-        tabela.setItemDelegateForColumn(4, date_delegate)
+    tabela.setItemDelegateForColumn(offset + Coluna.DATA_ENTRADA, date_delegate)
+    tabela.setItemDelegateForColumn(offset + Coluna.DATA_PROCESSO, date_delegate)
 
     tabela.setToolTip(
         "Clique duas vezes em uma célula para editar diretamente na tabela"
@@ -199,92 +185,131 @@ def criar_tabela(
     )
 
 
+def _criar_populador_linha(
+    tabela: QTableWidget,
+    is_admin: bool,
+) -> Callable[[int, Sequence[object]], tuple[str, str, str]]:
+    # pylint: disable=too-many-locals
+    """Especializa o preenchimento de uma linha para o perfil do usuário.
+
+    O perfil não muda durante o preenchimento; decidir aqui evita testar
+    ``is_admin`` a cada linha. O populador devolve a chave
+    ``(cliente, pedido, data de entrada exibida)`` com os textos já
+    formatados para a célula, reaproveitada no índice de linhas.
+    """
+    offset = 1 if is_admin else 0
+
+    # Invariantes do laço resolvidos uma única vez por preenchimento
+    set_item = tabela.setItem
+    alinhamento_centro = _ALINHAMENTO_CENTRO
+    col_cliente = offset + Coluna.CLIENTE
+    col_pedido = offset + Coluna.PEDIDO
+    col_qtde = offset + Coluna.QTDE
+    col_entrada = offset + Coluna.DATA_ENTRADA
+    col_processo = offset + Coluna.DATA_PROCESSO
+    col_tempo = offset + Coluna.TEMPO_CORTE
+    col_observacoes = offset + Coluna.OBSERVACOES
+    col_valor = offset + Coluna.VALOR
+
+    def popular_celulas(
+        row: int, registro: Sequence[object]
+    ) -> tuple[str, str, str]:
+        """Preenche as colunas comuns aos dois perfis (já deslocadas)."""
+        cliente = str(registro[2]).upper()
+        item_cliente = QTableWidgetItem(cliente)
+        item_cliente.setData(Qt.ItemDataRole.UserRole, registro[0])
+        set_item(row, col_cliente, item_cliente)
+
+        pedido = str(registro[3])
+        item_pedido = QTableWidgetItem(pedido)
+        item_pedido.setTextAlignment(alinhamento_centro)
+        set_item(row, col_pedido, item_pedido)
+
+        item_qtde = QTableWidgetItem(str(registro[4]))
+        item_qtde.setTextAlignment(alinhamento_centro)
+        set_item(row, col_qtde, item_qtde)
+
+        data_entrada_formatada = str(
+            formatar_data_para_exibicao(str(registro[5])))
+        item_data_entrada = QTableWidgetItem(data_entrada_formatada)
+        item_data_entrada.setTextAlignment(alinhamento_centro)
+        set_item(row, col_entrada, item_data_entrada)
+
+        if registro[6]:
+            data_processo_formatada: str = str(
+                formatar_data_para_exibicao(str(registro[6]))
+            )
+        else:
+            data_processo_formatada = "Não processado"
+        item_data_processo: QTableWidgetItem = QTableWidgetItem(
+            data_processo_formatada
+        )
+        item_data_processo.setTextAlignment(alinhamento_centro)
+        set_item(row, col_processo, item_data_processo)
+
+        tempo_corte_display = registro[7] or ""
+        item_tempo_corte = QTableWidgetItem(str(tempo_corte_display))
+        item_tempo_corte.setTextAlignment(alinhamento_centro)
+        set_item(row, col_tempo, item_tempo_corte)
+
+        observacoes_display = registro[8] or ""
+        item_observacoes = QTableWidgetItem(str(observacoes_display))
+        set_item(row, col_observacoes, item_observacoes)
+
+        valor_registro = registro[9]
+        # type: ignore[arg-type]
+        valor_float = float(
+            valor_registro) if valor_registro is not None else 0.0
+        item_valor = QTableWidgetItem(
+            formatar_valor_monetario(valor_float))
+        item_valor.setTextAlignment(_ALINHAMENTO_DIREITA)
+        set_item(row, col_valor, item_valor)
+
+        return cliente, pedido, data_entrada_formatada
+
+    if not is_admin:
+        # Sem coluna extra, as células comuns são a linha inteira
+        return popular_celulas
+
+    def popular_linha_admin(
+        row: int, registro: Sequence[object]
+    ) -> tuple[str, str, str]:
+        item_usuario = QTableWidgetItem(str(registro[1]))
+        item_usuario.setFlags(item_usuario.flags() & _NAO_EDITAVEL)
+        set_item(row, 0, item_usuario)
+        return popular_celulas(row, registro)
+
+    return popular_linha_admin
+
+
 def preencher_tabela(
     *,
     tabela: QTableWidget,
     registros: Sequence[Sequence[object]],
     is_admin: bool,
-) -> None:
-    # pylint: disable=too-many-locals
-    """Preenche a tabela com os registros fornecidos."""
+) -> dict[tuple[str, str, str], int]:
+    """Preenche a tabela com os registros fornecidos.
+
+    Retorna um índice ``(cliente, pedido, data de entrada exibida) -> linha``
+    com a primeira linha de cada combinação, na ordem do preenchimento.
+    """
+    indice_linhas: dict[tuple[str, str, str], int] = {}
     tabela.setUpdatesEnabled(False)
     tabela.blockSignals(True)
     tabela.setSortingEnabled(False)
     try:
+        # Descarta as linhas antigas de uma vez; sem isso cada setItem abaixo
+        # substitui (e destrói) individualmente o item anterior da célula.
+        tabela.setRowCount(0)
         tabela.setRowCount(len(registros))
-        offset = 1 if is_admin else 0
 
+        popular_linha = _criar_populador_linha(tabela, is_admin)
         for row, registro in enumerate(registros):
-            if is_admin:
-                item_usuario = QTableWidgetItem(str(registro[1]))
-                item_usuario.setFlags(
-                    item_usuario.flags() & ~Qt.ItemFlag.ItemIsEditable
-                )
-                tabela.setItem(row, 0, item_usuario)
-
-            item_cliente = QTableWidgetItem(str(registro[2]).upper())
-            tabela.setItem(row, offset + 0, item_cliente)
-
-            item_pedido = QTableWidgetItem(str(registro[3]))
-            item_pedido.setTextAlignment(
-                Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
-            )
-            tabela.setItem(row, offset + 1, item_pedido)
-
-            item_qtde = QTableWidgetItem(str(registro[4]))
-            item_qtde.setTextAlignment(
-                Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
-            )
-            tabela.setItem(row, offset + 2, item_qtde)
-
-            data_entrada_formatada = str(
-                formatar_data_para_exibicao(str(registro[5])))
-            item_data_entrada = QTableWidgetItem(data_entrada_formatada)
-            item_data_entrada.setTextAlignment(
-                Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
-            )
-            tabela.setItem(row, offset + 3, item_data_entrada)
-
-            if registro[6]:
-                data_processo_formatada: str = str(
-                    formatar_data_para_exibicao(str(registro[6]))
-                )
-            else:
-                data_processo_formatada = "Não processado"
-            item_data_processo: QTableWidgetItem = QTableWidgetItem(
-                data_processo_formatada
-            )
-            item_data_processo.setTextAlignment(
-                Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
-            )
-            tabela.setItem(row, offset + 4, item_data_processo)
-
-            tempo_corte_display = registro[7] or ""
-            item_tempo_corte = QTableWidgetItem(str(tempo_corte_display))
-            item_tempo_corte.setTextAlignment(
-                Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
-            )
-            tabela.setItem(row, offset + 5, item_tempo_corte)
-
-            observacoes_display = registro[8] or ""
-            item_observacoes = QTableWidgetItem(str(observacoes_display))
-            tabela.setItem(row, offset + 6, item_observacoes)
-
-            valor_registro = registro[9]
-            # type: ignore[arg-type]
-            valor_float = float(
-                valor_registro) if valor_registro is not None else 0.0
-            item_valor = QTableWidgetItem(
-                formatar_valor_monetario(valor_float))
-            item_valor.setTextAlignment(
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-            )
-            tabela.setItem(row, offset + 7, item_valor)
-
-            item = tabela.item(row, offset + 0)
-            if item is not None:
-                item.setData(Qt.ItemDataRole.UserRole, registro[0])
+            # A chave vem dos textos já formatados para as células
+            indice_linhas.setdefault(popular_linha(row, registro), row)
     finally:
         tabela.setSortingEnabled(True)
         tabela.blockSignals(False)
         tabela.setUpdatesEnabled(True)
+
+    return indice_linhas
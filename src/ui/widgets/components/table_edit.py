@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import Tuple
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QTableWidget
 
 from src.core.formatters import (converter_data_para_banco,
+                                 converter_valor_monetario,
                                  normalizar_nome_cliente)
+from src.ui.widgets.components.table import Coluna
 
 __all__ = [
     "LinhaPedidoEdicao",
@@ -19,6 +22,9 @@ __all__ = [
     "obter_registro_id",
 ]
 
+# DD/MM/AAAA (dia e mês com um ou dois dígitos, como aceito por strptime)
+_DATA_EXIBICAO_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$")
+
 
 @dataclass
 class LinhaPedidoEdicao:
@@ -51,16 +57,7 @@ def validar_edicao_celula(
     col_editada: int, valor_editado: str
 ) -> Tuple[bool, str | None]:
     """Valida o conteúdo da célula editada."""
-    validators = {
-        2: _validar_qtde,
-        3: _validar_data_entrada,
-        4: _validar_data_processo,
-        5: _validar_tempo_corte,
-        6: _validar_observacoes,
-        7: _validar_valor,
-    }
-
-    validador = validators.get(col_editada)
+    validador = _VALIDADORES.get(col_editada)
     if not validador:
         return True, None
     return validador(valor_editado)
@@ -72,15 +69,18 @@ def extrair_campos_linha(
     col_offset: int,
 ) -> LinhaPedidoEdicao:
     """Extrai os campos da linha informada, convertendo para formatos de banco."""
-    cliente = normalizar_nome_cliente(_texto_item(tabela, row, col_offset))
-    pedido = _texto_item(tabela, row, col_offset + 1)
-    qtde_itens = _texto_item(tabela, row, col_offset + 2)
+    (
+        cliente_text,
+        pedido,
+        qtde_itens,
+        data_entrada_text,
+        data_processo_text,
+        tempo_corte_text,
+        observacoes_text,
+        valor_text,
+    ) = _textos_linha(tabela, row, col_offset, 8)
 
-    data_entrada_text = _texto_item(tabela, row, col_offset + 3)
-    data_processo_text = _texto_item(tabela, row, col_offset + 4)
-    tempo_corte_text = _texto_item(tabela, row, col_offset + 5)
-    observacoes_text = _texto_item(tabela, row, col_offset + 6)
-    valor_text = _texto_item(tabela, row, col_offset + 7)
+    cliente = normalizar_nome_cliente(cliente_text)
 
     data_entrada = converter_data_para_banco(data_entrada_text)
     if data_processo_text == "Não processado" or not data_processo_text:
@@ -104,18 +104,22 @@ def extrair_campos_linha(
 
 def obter_registro_id(tabela: QTableWidget, row: int, is_admin: bool) -> int | None:
     """Obtém o ID do registro armazenado na linha da tabela."""
-    coluna_id = 1 if is_admin else 0
+    coluna_id = Coluna.CLIENTE + (1 if is_admin else 0)
     item = tabela.item(row, coluna_id)
     if not item:
         return None
     return item.data(Qt.ItemDataRole.UserRole)
 
 
-def _texto_item(tabela: QTableWidget, row: int, col: int) -> str:
-    item = tabela.item(row, col)
-    if not item:
+def _textos_linha(
+    tabela: QTableWidget, row: int, col_inicial: int, quantidade: int
+) -> list[str]:
+    """Lê, em uma única passagem, os textos das colunas consecutivas da linha."""
+    itens = [tabela.item(row, col)
+             for col in range(col_inicial, col_inicial + quantidade)]
+    if not all(itens):
         raise ValueError("Item da tabela não encontrado.")
-    return item.text().strip()
+    return [item.text().strip() for item in itens]
 
 
 def _validar_qtde(valor_editado: str) -> Tuple[bool, str | None]:
@@ -140,13 +144,17 @@ def _validar_data(valor_editado: str, tipo: str) -> Tuple[bool, str | None]:
     if not valor_editado or valor_editado == "Não processado":
         return True, None
 
+    correspondencia = _DATA_EXIBICAO_RE.match(valor_editado)
     try:
-        data_obj = datetime.strptime(valor_editado, "%d/%m/%Y")
+        if not correspondencia:
+            raise ValueError
+        dia, mes, ano = correspondencia.groups()
+        data_obj = date(int(ano), int(mes), int(dia))
     except ValueError:
         mensagem = "Data de entrada" if tipo == "entrada" else "Data de processo"
         return False, f"{mensagem} deve estar no formato DD/MM/AAAA."
 
-    if data_obj.date() > datetime.now(timezone.utc).date():
+    if data_obj > datetime.now(timezone.utc).date():
         mensagem = "Data de entrada" if tipo == "entrada" else "Data de processo"
         return False, f"{mensagem} não pode ser maior que a data atual."
 
@@ -180,15 +188,19 @@ def _validar_observacoes(observacoes_editadas: str) -> Tuple[bool, str | None]:
 
 def _validar_valor(valor_editado: str) -> Tuple[bool, str | None]:
     try:
-        valor_limpo = (
-            valor_editado.replace("R$", "")
-            .replace(" ", "")
-            .replace(".", "")
-            .replace(",", ".")
-        )
-        valor_test = float(valor_limpo)
+        valor_test = converter_valor_monetario(valor_editado)
         if valor_test < 0:
             raise ValueError
     except ValueError:
         return False, "Valor deve ser um número válido e não negativo."
     return True, None
+
+
+_VALIDADORES = {
+    Coluna.QTDE: _validar_qtde,
+    Coluna.DATA_ENTRADA: _validar_data_entrada,
+    Coluna.DATA_PROCESSO: _validar_data_processo,
+    Coluna.TEMPO_CORTE: _validar_tempo_corte,
+    Coluna.OBSERVACOES: _validar_observacoes,
+    Coluna.VALOR: _validar_valor,
+}
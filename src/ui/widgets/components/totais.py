@@ -17,12 +17,10 @@ class TotaisControls:
     """Agrupa os widgets do painel de totais."""
 
     frame: QFrame
-    label_pedidos: QLabel
-    label_itens: QLabel
+    label_totais: QLabel
     label_media_itens_por_dia: QLabel
     label_estimativa_itens: QLabel
     label_media_dias: QLabel
-    label_valor: QLabel
     label_tempo_corte_total: QLabel
     label_media_tempo_corte_dia: QLabel
     label_tempo_corte_dia: QLabel
@@ -38,49 +36,39 @@ def criar_totais(*, parent, espacamento: int) -> TotaisControls:
         v_spacing=espacamento,
     )
 
-    label_pedidos = QLabel("Pedidos período: 0")
-    label_itens = QLabel("Itens período: 0")
+    # Pedidos, itens e valor são atualizados juntos: um único rótulo evita
+    # três ciclos de setText/repaint e três filhos no layout.
+    label_totais = QLabel(
+        "Pedidos período: --  |  Itens período: --  |  Valor total: --"
+    )
     label_media_itens_por_dia = QLabel("Média itens/dia: --")
     label_estimativa_itens = QLabel("Estimativa itens período: --")
     label_media_dias = QLabel("Média dias processo: --")
-    label_valor = QLabel("Valor total: R$ 0,00")
     label_tempo_corte_total = QLabel("Tempo corte período: --")
     label_media_tempo_corte_dia = QLabel("Média tempo corte/dia: --")
     label_tempo_corte_dia = QLabel("Tempo corte hoje: --")
 
     for label in (
-        label_pedidos,
-        label_itens,
+        label_totais,
         label_media_itens_por_dia,
         label_estimativa_itens,
         label_media_dias,
-        label_valor,
         label_tempo_corte_total,
         label_media_tempo_corte_dia,
         label_tempo_corte_dia,
     ):
         label.setObjectName("label_titulo_negrito")
-
-    layout.addWidget(label_pedidos)
-    layout.addWidget(label_itens)
-    layout.addWidget(label_media_itens_por_dia)
-    layout.addWidget(label_estimativa_itens)
-    layout.addWidget(label_media_dias)
-    layout.addWidget(label_valor)
-    layout.addWidget(label_tempo_corte_total)
-    layout.addWidget(label_media_tempo_corte_dia)
-    layout.addWidget(label_tempo_corte_dia)
+        label.setTextFormat(Qt.TextFormat.RichText)
+        layout.addWidget(label)
 
     frame.setLayout(layout)
 
     return TotaisControls(
         frame=frame,
-        label_pedidos=label_pedidos,
-        label_itens=label_itens,
+        label_totais=label_totais,
         label_media_itens_por_dia=label_media_itens_por_dia,
         label_estimativa_itens=label_estimativa_itens,
         label_media_dias=label_media_dias,
-        label_valor=label_valor,
         label_tempo_corte_total=label_tempo_corte_total,
         label_media_tempo_corte_dia=label_media_tempo_corte_dia,
         label_tempo_corte_dia=label_tempo_corte_dia,
@@ -109,29 +97,16 @@ def atualizar_totais(
     def _fmt(titulo: str, valor: Any, cor: str = cor_destaque) -> str:
         return f"{titulo}: <span style='color: {cor};'>{valor}</span>"
 
-    # Configurar todos para RichText
-    for label in (
-        controles.label_pedidos,
-        controles.label_itens,
-        controles.label_valor,
-        controles.label_media_itens_por_dia,
-        controles.label_estimativa_itens,
-        controles.label_tempo_corte_total,
-        controles.label_media_tempo_corte_dia,
-        controles.label_tempo_corte_dia,
-    ):
-        label.setTextFormat(Qt.TextFormat.RichText)
-
-    controles.label_pedidos.setText(_fmt("Pedidos período", total_pedidos))
-    controles.label_itens.setText(_fmt("Itens período", total_itens))
-    controles.label_valor.setText(_fmt("Valor total", formatar_valor(total_valor)))
+    controles.label_totais.setText(
+        f"{_fmt('Pedidos período', total_pedidos)}  |  "
+        f"{_fmt('Itens período', total_itens)}  |  "
+        f"{_fmt('Valor total', formatar_valor(total_valor))}"
+    )
 
     if media_dias_processo is None:
-        controles.label_media_dias.setTextFormat(Qt.TextFormat.RichText)
         controles.label_media_dias.setText(_fmt("Média dias processo", "--"))
     else:
         cor_media = _obter_cor_media_dias(media_dias_processo)
-        controles.label_media_dias.setTextFormat(Qt.TextFormat.RichText)
         controles.label_media_dias.setText(
             f"Média dias processo: <span style='color: {cor_media}; font-weight: bold'>"
             f"{media_dias_processo:.1f}</span>"
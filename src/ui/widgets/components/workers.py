@@ -0,0 +1,72 @@
+"""Execução de consultas ao banco fora da thread da interface."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerSignals(QObject):
+    """Sinais emitidos por :class:`DbWorker` ao término da tarefa.
+
+    Ambos carregam o ``contexto`` informado na criação do worker, permitindo
+    ao receptor descartar resultados obsoletos sem recorrer a closures.
+    """
+
+    concluido = Signal(object, object)
+    falhou = Signal(object, str)
+
+
+class DbWorker(QRunnable):
+    """Executa ``funcao(*args, **kwargs)`` em uma thread do ``QThreadPool``."""
+
+    def __init__(
+        self,
+        funcao: Callable[..., Any],
+        *args: Any,
+        contexto: Any = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__()
+        self._funcao = funcao
+        self._args = args
+        self._kwargs = kwargs
+        self._contexto = contexto
+        self.signals = WorkerSignals()
+
+    def run(self) -> None:
+        """Executa a função e emite o resultado (ou a falha)."""
+        try:
+            resultado = self._funcao(*self._args, **self._kwargs)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.exception("Erro em tarefa de segundo plano: %s", e)
+            self.signals.falhou.emit(self._contexto, str(e))
+            return
+        self.signals.concluido.emit(self._contexto, resultado)
+
+
+def executar_em_segundo_plano(
+    funcao: Callable[..., Any],
+    *args: Any,
+    ao_concluir: Callable[[Any, Any], None],
+    ao_falhar: Callable[[Any, str], None] | None = None,
+    contexto: Any = None,
+    **kwargs: Any,
+) -> DbWorker:
+    """Agenda ``funcao`` no pool global e conecta os callbacks de retorno.
+
+    Os callbacks devem ser métodos de um ``QObject`` da thread da interface:
+    a conexão enfileirada garante que rodem no loop de eventos principal.
+    """
+    worker = DbWorker(funcao, *args, contexto=contexto, **kwargs)
+    worker.signals.concluido.connect(
+        ao_concluir, Qt.ConnectionType.QueuedConnection)
+    if ao_falhar is not None:
+        worker.signals.falhou.connect(
+            ao_falhar, Qt.ConnectionType.QueuedConnection)
+    QThreadPool.globalInstance().start(worker)
+    return worker
@@ -6,29 +6,79 @@ tabela de dados e controles de filtros.
 """
 
 import logging
-from datetime import date, datetime
+from datetime import date
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer
 from PySide6.QtGui import QKeySequence, QShortcut
-from PySide6.QtWidgets import QMessageBox, QVBoxLayout, QWidget
+from PySide6.QtWidgets import QMainWindow, QMessageBox, QVBoxLayout, QWidget
 
 from src import data as db
-from src.core.formatters import (formatar_data_para_exibicao,
+from src.core.formatters import (RE_NAO_DIGITO, formatar_data_para_exibicao,
                                  formatar_valor_monetario,
                                  normalizar_nome_cliente,
                                  normalizar_valor_padrao_brasileiro)
 from src.core.periodo_faturamento import (
     calcular_periodo_faturamento_atual_datas,
     calcular_periodo_faturamento_para_data_datas)
+from src.core.tempo_corte import normalizar_tempo_corte
+from src.data.helpers import processar_observacoes, validar_e_processar_valor
 from src.ui.styles import ESPACAMENTO_PADRAO, obter_data_atual_utc
 from src.ui.widgets.components import autocomplete
 from src.ui.widgets.components import data_service as data
 from src.ui.widgets.components import (filters, form, periodo, table,
-                                       table_edit, totais)
+                                       table_edit, totais, workers)
+from src.ui.widgets.components.table import Coluna
 
 logger = logging.getLogger(__name__)
 
 
+# Colunas (sem o deslocamento do admin) cuja edição é refletida diretamente
+# na linha: posição no registro e campo correspondente de LinhaPedidoEdicao.
+_CAMPOS_REGISTRO_POR_COLUNA = {
+    Coluna.CLIENTE: (2, "cliente"),
+    Coluna.PEDIDO: (3, "pedido"),
+    Coluna.QTDE: (4, "qtde_itens"),
+    Coluna.TEMPO_CORTE: (7, "tempo_corte"),
+    Coluna.OBSERVACOES: (8, "observacoes"),
+    Coluna.VALOR: (9, "valor_pedido"),
+}
+
+_COLUNAS_DATA = (Coluna.DATA_ENTRADA, Coluna.DATA_PROCESSO)
+
+# Campos de texto do formulário de inclusão: chave em form_data -> atributo
+_CAMPOS_FORM = (
+    ("cliente", "entry_cliente"),
+    ("pedido", "entry_pedido"),
+    ("qtde_itens", "entry_qtde_itens"),
+    ("valor_pedido", "entry_valor_pedido"),
+    ("tempo_corte", "entry_tempo_corte"),
+)
+# Campos do formulário exigidos pelo CRUD ao inserir, na ordem de foco
+_CAMPOS_OBRIGATORIOS = (
+    "entry_cliente",
+    "entry_pedido",
+    "entry_qtde_itens",
+    "entry_valor_pedido",
+)
+
+
+def _limites_iso(periodo_inicio: date, periodo_fim: date) -> tuple[str, str]:
+    """Início e fim do período em AAAA-MM-DD, como no combo de períodos.
+
+    Os cálculos de período devolvem ``datetime`` à meia-noite; o recorte
+    ``[:10]`` vale tanto para ``date`` quanto para ``datetime``.
+    """
+    return periodo_inicio.isoformat()[:10], periodo_fim.isoformat()[:10]
+
+
+def _texto_periodo(periodo_inicio: date, periodo_fim: date) -> str:
+    """Texto ``DD/MM a DD/MM`` exibido no combo de períodos."""
+    return (
+        f"{periodo_inicio.day:02d}/{periodo_inicio.month:02d} a "
+        f"{periodo_fim.day:02d}/{periodo_fim.month:02d}"
+    )
+
+
 class ProcessosWidget(QWidget):
     """Widget principal para gerenciamento de pedidos."""
 
@@ -37,6 +87,8 @@ class ProcessosWidget(QWidget):
         super().__init__()
         self.is_admin = is_admin
         self.usuario_logado = usuario_logado
+        # Deslocamento das colunas causado pela coluna "Usuário" do admin
+        self._col_offset = 1 if is_admin else 0
 
         self.frame_entrada = None
         self.botoes_layout = None
@@ -54,12 +106,9 @@ class ProcessosWidget(QWidget):
         self.tabela = None
         self.entry_filtro_cliente = None
         self.entry_filtro_pedido = None
-        self.timer_cliente = None
-        self.timer_pedido = None
+        self.timer_texto = None
         self.btn_limpar_filtros = None
-        self.label_total_pedidos = None
-        self.label_total_itens = None
-        self.label_total_valor = None
+        self.label_totais = None
         self.shortcut_enter = None
         self.shortcut_enter_num = None
         self.shortcut_delete = None
@@ -75,9 +124,42 @@ class ProcessosWidget(QWidget):
         self.periodo_controller = None
         self._timer_atualizacao_datas = None
 
+        # Agrupa pedidos de filtro disparados em sequência (digitação, combos)
+        # em uma única consulta ao banco e repopulação da tabela.
+        self._rolar_filtro_pendente = False
+        self._timer_filtro = QTimer(self)
+        self._timer_filtro.setSingleShot(True)
+        self._timer_filtro.setInterval(150)
+        self._timer_filtro.timeout.connect(self._executar_filtro_agendado)
+
+        # Agrupa atualizações do autocompletar após inserções em sequência
+        self._timer_autocomplete = QTimer(self)
+        self._timer_autocomplete.setSingleShot(True)
+        self._timer_autocomplete.setInterval(300)
+        self._timer_autocomplete.timeout.connect(self._atualizar_autocomplete)
+
+        # Identificador do último filtro enviado ao pool de threads e registro
+        # a destacar quando a tabela correspondente for preenchida.
+        self._filtro_req_id = 0
+        self._ultimos_filtros_solicitados = None
+        self._registro_para_selecionar = None
+        # Resultado atualmente exibido na tabela, reaproveitado pelos totais
+        # quando uma edição é aplicada diretamente na linha.
+        self._registros_exibidos = None
+        self._filtros_exibidos = None
+        self._indice_linhas = {}
+        self._salvando_pedido = False
+        self._excluindo_pedido = False
+        # Anos do filtro de ano para o usuário filtrado; carregado sob demanda
+        # e mantido incrementalmente a cada inserção.
+        self._anos_disponiveis_cache = None
+        # Totais adiados enquanto o painel estava oculto
+        self._totais_pendentes = False
+
         self.init_ui()
         self._configurar_atualizacao_automatica_datas()
-        self.carregar_dados()
+        # Os dados iniciais chegam depois que o widget já foi exibido
+        QTimer.singleShot(0, self.carregar_dados)
 
     def init_ui(self):
         """Inicializa a interface do usuário."""
@@ -127,14 +209,17 @@ class ProcessosWidget(QWidget):
         """Reage à mudança de ano no filtro."""
         if self.periodo_controller:
             self.periodo_controller.on_ano_changed()
-        self.aplicar_filtro()
+        self.agendar_filtro(rolar_para_ultimo=True)
 
     def _converter_cliente_maiuscula(self, texto):
         """Convert the client field text to uppercase automatically."""
+        texto_normalizado = normalizar_nome_cliente(texto)
+        if texto_normalizado == texto:
+            return  # Já normalizado: evita setText e novo layout do campo
+
         self.entry_cliente.blockSignals(True)
         try:
             posicao_cursor = self.entry_cliente.cursorPosition()
-            texto_normalizado = normalizar_nome_cliente(texto)
             self.entry_cliente.setText(texto_normalizado)
             self.entry_cliente.setCursorPosition(
                 min(posicao_cursor, len(texto_normalizado))
@@ -147,9 +232,11 @@ class ProcessosWidget(QWidget):
         if self.entry_tempo_corte is None:
             return
 
-        digitos = "".join(ch for ch in texto if ch.isdigit())[:6]
+        digitos = RE_NAO_DIGITO.sub("", texto)[:6]
 
         if not digitos:
+            if not texto:
+                return
             self.entry_tempo_corte.blockSignals(True)
             self.entry_tempo_corte.setText("")
             self.entry_tempo_corte.blockSignals(False)
@@ -166,6 +253,8 @@ class ProcessosWidget(QWidget):
             partes.append(segundos)
 
         formato = ":".join(partes)
+        if formato == texto:
+            return
 
         self.entry_tempo_corte.blockSignals(True)
         self.entry_tempo_corte.setText(formato)
@@ -177,9 +266,12 @@ class ProcessosWidget(QWidget):
         if self.entry_valor_pedido is None:
             return
 
+        valor_formatado = normalizar_valor_padrao_brasileiro(texto)
+        if valor_formatado == texto:
+            return
+
         self.entry_valor_pedido.blockSignals(True)
         try:
-            valor_formatado = normalizar_valor_padrao_brasileiro(texto)
             self.entry_valor_pedido.setText(valor_formatado)
             self.entry_valor_pedido.setCursorPosition(len(valor_formatado))
         finally:
@@ -189,6 +281,16 @@ class ProcessosWidget(QWidget):
         """Garante atualização de datas quando o widget volta a ser exibido."""
         super().showEvent(event)
         self._verificar_atualizacao_datas_formulario(forcar=True)
+        if self._timer_atualizacao_datas is not None:
+            self._timer_atualizacao_datas.start()
+        if self._totais_pendentes and self._registros_exibidos is not None:
+            self.atualizar_totais(self._filtros_exibidos, self._registros_exibidos)
+
+    def hideEvent(self, event):  # pylint: disable=invalid-name
+        """Suspende a verificação periódica de datas enquanto oculto."""
+        super().hideEvent(event)
+        if self._timer_atualizacao_datas is not None:
+            self._timer_atualizacao_datas.stop()
 
     def _configurar_atualizacao_automatica_datas(self) -> None:
         """Configura a atualização periódica dos campos de data."""
@@ -252,22 +354,17 @@ class ProcessosWidget(QWidget):
 
     def atalho_adicionar_pedido(self):
         """Adiciona pedido via atalho se campos obrigatórios estiverem ok."""
-        cliente = self.entry_cliente.text().strip()
-        pedido = self.entry_pedido.text().strip()
-        qtde_itens = self.entry_qtde_itens.text().strip()
-        valor_pedido = self.entry_valor_pedido.text().strip()
-
-        if cliente and pedido and qtde_itens and valor_pedido:
+        if not self._focar_campo_obrigatorio_vazio():
             self.adicionar_pedido()
-        else:
-            if not cliente:
-                self.entry_cliente.setFocus()
-            elif not pedido:
-                self.entry_pedido.setFocus()
-            elif not qtde_itens:
-                self.entry_qtde_itens.setFocus()
-            elif not valor_pedido:
-                self.entry_valor_pedido.setFocus()
+
+    def _focar_campo_obrigatorio_vazio(self) -> bool:
+        """Foca o primeiro campo obrigatório vazio; indica se havia algum."""
+        for atributo in _CAMPOS_OBRIGATORIOS:
+            campo = getattr(self, atributo)
+            if not campo.text().strip():
+                campo.setFocus()
+                return True
+        return False
 
     def _criar_frame_entrada(self):
         """Cria o frame de entrada de dados."""
@@ -297,13 +394,9 @@ class ProcessosWidget(QWidget):
         filtros = filters.criar_filtros(
             parent=self,
             is_admin=self.is_admin,
-            on_cliente_timeout=lambda: self.aplicar_filtro(
-                rolar_para_ultimo=False),
-            on_pedido_timeout=lambda: self.aplicar_filtro(
-                rolar_para_ultimo=False),
+            on_texto_timeout=self._executar_filtro_agendado,
             on_ano_changed=self.on_ano_changed,
-            on_periodo_changed=lambda _: self.aplicar_filtro(
-                rolar_para_ultimo=False),
+            on_periodo_changed=lambda _: self.agendar_filtro(),
             on_usuario_changed=self.on_usuario_changed,
             on_limpar=self.limpar_filtros,
         )
@@ -315,8 +408,7 @@ class ProcessosWidget(QWidget):
         self.combo_filtro_ano = filtros.combo_ano
         self.combo_filtro_periodo = filtros.combo_periodo
         self.btn_limpar_filtros = filtros.btn_limpar
-        self.timer_cliente = filtros.timer_cliente
-        self.timer_pedido = filtros.timer_pedido
+        self.timer_texto = filtros.timer_texto
 
         self.periodo_controller = periodo.PeriodoFiltroController(
             combo_ano=self.combo_filtro_ano,
@@ -350,26 +442,28 @@ class ProcessosWidget(QWidget):
 
         self.controles_totais = controles_totais
         self.frame_totais = controles_totais.frame
-        self.label_total_pedidos = controles_totais.label_pedidos
-        self.label_total_itens = controles_totais.label_itens
-        self.label_total_valor = controles_totais.label_valor
+        self.label_totais = controles_totais.label_totais
 
     def limpar_filtros(self):
-        """Limpa filtros mantendo o período corrente selecionado."""
-        if self.is_admin and hasattr(self, "combo_usuario"):
-            self.combo_usuario.blockSignals(True)
-            self.combo_usuario.setCurrentText("Todos os usuários")
-            self.combo_usuario.blockSignals(False)
-
-        if hasattr(self, "entry_filtro_cliente"):
-            self.entry_filtro_cliente.blockSignals(True)
-            self.entry_filtro_cliente.clear()
-            self.entry_filtro_cliente.blockSignals(False)
-
-        if hasattr(self, "entry_filtro_pedido"):
-            self.entry_filtro_pedido.blockSignals(True)
-            self.entry_filtro_pedido.clear()
-            self.entry_filtro_pedido.blockSignals(False)
+        """Limpa filtros mantendo o período corrente selecionado.
+
+        Os sinais dos campos ficam bloqueados e a digitação pendente é
+        descartada: a única consulta é a do aplicar_filtro final.
+        """
+        if self.timer_texto is not None:
+            self.timer_texto.stop()
+
+        if self.combo_usuario is not None:
+            with QSignalBlocker(self.combo_usuario):
+                self.combo_usuario.setCurrentText("Todos os usuários")
+
+        if self.entry_filtro_cliente is not None:
+            with QSignalBlocker(self.entry_filtro_cliente):
+                self.entry_filtro_cliente.clear()
+
+        if self.entry_filtro_pedido is not None:
+            with QSignalBlocker(self.entry_filtro_pedido):
+                self.entry_filtro_pedido.clear()
 
         self.aplicar_filtro_periodo_corrente()
         self.aplicar_filtro()
@@ -391,10 +485,7 @@ class ProcessosWidget(QWidget):
         # Ajuste: Usar o ano da data final para definir o ano corrente
         # Ex: Periodo Dez/25 a Jan/26 deve ser visualizado como 2026
         ano_atual = str(data_fim_atual.year)
-        periodo_display = (
-            f"{data_inicio_atual.strftime('%d/%m')} a "
-            f"{data_fim_atual.strftime('%d/%m')}"
-        )
+        periodo_display = _texto_periodo(data_inicio_atual, data_fim_atual)
 
         self.periodo_controller.selecionar_ano(ano_atual)
         self.periodo_controller.on_ano_changed()
@@ -402,24 +493,42 @@ class ProcessosWidget(QWidget):
 
     def on_usuario_changed(self):
         """Reage à mudança de usuário no filtro (admins)."""
+        self._anos_disponiveis_cache = None
         self.configurar_filtros_ano_periodo()
-        self.aplicar_filtro()
+        self.agendar_filtro(rolar_para_ultimo=True)
 
     def carregar_dados(self):
-        """Carrega usuários, configura filtros e aplica período corrente."""
-        if self.is_admin and hasattr(self, "combo_usuario"):
-            usuarios_list = db.buscar_usuarios_unicos()
-            for user in usuarios_list:
-                self.combo_usuario.addItem(user)
+        """Carrega usuários, configura filtros e aplica período corrente.
+
+        Usuários, anos e períodos são buscados em segundo plano; os filtros
+        são configurados quando o resultado chega.
+        """
+        workers.executar_em_segundo_plano(
+            data.carregar_dados_iniciais,
+            self._calcular_usuario_filtro(),
+            incluir_usuarios=self.combo_usuario is not None,
+            ao_concluir=self._on_dados_iniciais_carregados,
+            ao_falhar=self._on_dados_iniciais_falharam,
+        )
+
+    def _on_dados_iniciais_carregados(self, _contexto, usuarios_list):
+        """Preenche o combo de usuários e aplica o período corrente."""
+        if self.combo_usuario is not None:
+            self.combo_usuario.addItems(usuarios_list)
 
         self.configurar_filtros_ano_periodo()
         self.aplicar_filtro_periodo_corrente()
         self.aplicar_filtro()
-        QTimer.singleShot(100, self.rolar_para_ultimo_item)
+
+    def _on_dados_iniciais_falharam(self, contexto, _erro):
+        """Segue com a configuração dos filtros mesmo sem a lista de usuários."""
+        self._on_dados_iniciais_carregados(contexto, [])
 
     def atualizar_dados(self):
         """Atualiza dados da tabela e recarrega lista de autocompletar."""
-        if self.is_admin and hasattr(self, "combo_usuario"):
+        data.invalidar_cache()
+        self._anos_disponiveis_cache = None
+        if self.combo_usuario is not None:
             usuarios_db = db.buscar_usuarios_unicos()
             usuarios_combo = {
                 self.combo_usuario.itemText(i)
@@ -434,8 +543,19 @@ class ProcessosWidget(QWidget):
                     self.combo_usuario.addItem(user)
                 self.combo_usuario.blockSignals(False)
 
-        self.autocomplete_manager.refresh_all()
-        self.aplicar_filtro()
+        self._timer_autocomplete.start()
+        self._reaplicar_filtro(rolar_para_ultimo=True)
+
+    def _atualizar_autocomplete(self):
+        """Busca os clientes em segundo plano para o autocompletar."""
+        workers.executar_em_segundo_plano(
+            data.carregar_clientes_upper,
+            ao_concluir=self._on_clientes_autocomplete_carregados,
+        )
+
+    def _on_clientes_autocomplete_carregados(self, _contexto, clientes):
+        """Aplica a lista de clientes recém-carregada aos autocompletes."""
+        self.autocomplete_manager.aplicar_clientes(clientes)
 
     # pylint: disable=R0912,R0914
 
@@ -448,10 +568,10 @@ class ProcessosWidget(QWidget):
             self.tabela.blockSignals(True)
             row = item.row()
             col = item.column()
-            col_offset = 1 if self.is_admin else 0
+            col_offset = self._col_offset
 
             if self.is_admin and col == 0:
-                self.aplicar_filtro(rolar_para_ultimo=False)
+                self._reaplicar_filtro()
                 return
 
             registro_id = table_edit.obter_registro_id(
@@ -467,7 +587,7 @@ class ProcessosWidget(QWidget):
             if not ok:
                 if erro_msg:
                     QMessageBox.warning(self, "Erro", erro_msg)
-                self.aplicar_filtro(rolar_para_ultimo=False)
+                self._reaplicar_filtro()
                 return
 
             dados_linha = table_edit.extrair_campos_linha(
@@ -477,13 +597,13 @@ class ProcessosWidget(QWidget):
             )
 
             # Validação cruzada de datas
-            if col_editada in (3, 4):  # data_entrada ou data_processo
+            if col_editada in _COLUNAS_DATA:
                 ok_datas, msg_datas = self._validar_datas_entrada_processo(
                     dados_linha.data_entrada, dados_linha.data_processo
                 )
                 if not ok_datas:
                     QMessageBox.warning(self, "Erro", msg_datas)
-                    self.aplicar_filtro(rolar_para_ultimo=False)
+                    self._reaplicar_filtro()
                     return
 
             resultado = db.atualizar_lancamento(
@@ -491,38 +611,34 @@ class ProcessosWidget(QWidget):
                 **dados_linha.to_update_kwargs(),
             )
 
-            if "Sucesso" in resultado and col_editada == 3:
-                self.configurar_filtros_ano_periodo()
+            if "Sucesso" in resultado:
+                data.invalidar_cache()
+                if col_editada == Coluna.DATA_ENTRADA:
+                    self.configurar_filtros_ano_periodo()
 
             if "Sucesso" in resultado:
                 # Verificar se o período do registro editado precisa ajustar o filtro
-                if col_editada in (3, 4):  # data_entrada ou data_processo
+                if col_editada in _COLUNAS_DATA:
                     # Usar data_processo se disponível, senão data_entrada
                     data_registro_str = (
                         dados_linha.data_processo or dados_linha.data_entrada
                     )
-                    if data_registro_str:
-                        data_registro = datetime.strptime(
-                            data_registro_str, "%Y-%m-%d")
+                    # Sem controle de período não há seleção a comparar
+                    if data_registro_str and self.periodo_controller is not None:
+                        data_registro = date.fromisoformat(data_registro_str)
                         periodo_inicio, periodo_fim = (
                             calcular_periodo_faturamento_para_data_datas(
                                 data_registro)
                         )
 
                         # Verificar se o filtro já está no período do registro
-                        periodo_selecionado_inicio, periodo_selecionado_fim = (
-                            self.periodo_controller.obter_periodo_selecionado()
-                            if self.periodo_controller
-                            else (None, None)
-                        )
                         filtro_no_periodo_registro = (
-                            periodo_selecionado_inicio
-                            == periodo_inicio.strftime("%Y-%m-%d")
-                            and periodo_selecionado_fim
-                            == periodo_fim.strftime("%Y-%m-%d")
+                            self.periodo_controller.obter_periodo_selecionado()
+                            == _limites_iso(periodo_inicio, periodo_fim)
                         )
 
                         if not filtro_no_periodo_registro:
+                            # O ajuste já reaplica o filtro com o novo período
                             self._ajustar_periodo_para_registro(
                                 periodo_inicio,
                                 periodo_fim,
@@ -530,19 +646,76 @@ class ProcessosWidget(QWidget):
                                 dados_linha.pedido,
                                 dados_linha.data_entrada,
                             )
+                            return
 
             if "Sucesso" not in resultado:
                 QMessageBox.warning(self, "Erro", resultado)
+            elif self._edicao_permite_atualizar_linha(col_editada):
+                self._atualizar_linha_editada(
+                    item, registro_id, col_editada, dados_linha)
+                return
 
-            self.aplicar_filtro(rolar_para_ultimo=False)
+            self._reaplicar_filtro()
 
         except (ValueError, AttributeError, TypeError) as e:
-            self.aplicar_filtro(rolar_para_ultimo=False)
+            self._reaplicar_filtro()
             QMessageBox.warning(
                 self, "Erro", f"Erro ao atualizar registro: {str(e)}")
         finally:
             self.tabela.blockSignals(False)
 
+    def _edicao_permite_atualizar_linha(self, col_editada: int) -> bool:
+        """Indica se a edição salva pode ser refletida sem refazer o filtro.
+
+        Datas alteram a ordenação e o período do registro; cliente e pedido
+        podem deixar de casar com o filtro de texto ativo.
+        """
+        if self._registros_exibidos is None:
+            return False
+        if col_editada not in _CAMPOS_REGISTRO_POR_COLUNA:
+            return False
+        if col_editada in (Coluna.CLIENTE, Coluna.PEDIDO):
+            return not any(self._obter_filtros_texto())
+        return True
+
+    def _atualizar_linha_editada(self, item, registro_id, col_editada, dados_linha):
+        """Atualiza a célula editada e os totais sem nova consulta ao banco.
+
+        O valor passa pelos mesmos normalizadores usados na gravação, para que
+        a célula e os totais reflitam exatamente o que ficou no banco.
+        """
+        indice_registro, campo = _CAMPOS_REGISTRO_POR_COLUNA[col_editada]
+        valor = getattr(dados_linha, campo)
+        if col_editada == Coluna.QTDE:
+            valor = int(valor)
+            texto = str(valor)
+        elif col_editada == Coluna.VALOR:
+            valor = validar_e_processar_valor(valor)
+            if isinstance(valor, str):
+                # Mensagem de erro: não há valor gravado confiável a exibir
+                self._reaplicar_filtro()
+                return
+            texto = formatar_valor_monetario(valor)
+        elif col_editada == Coluna.TEMPO_CORTE:
+            valor, _ = normalizar_tempo_corte(valor)
+            texto = valor or ""
+        elif col_editada == Coluna.OBSERVACOES:
+            valor = processar_observacoes(valor)
+            texto = valor or ""
+        else:
+            valor = valor.strip()
+            texto = valor
+        item.setText(texto)
+
+        for indice, registro in enumerate(self._registros_exibidos):
+            if registro[0] == registro_id:
+                atualizado = list(registro)
+                atualizado[indice_registro] = valor
+                self._registros_exibidos[indice] = tuple(atualizado)
+                break
+
+        self.atualizar_totais(self._filtros_exibidos, self._registros_exibidos)
+
     def _validar_datas_entrada_processo(
         self, data_entrada: str | None, data_processo: str | None
     ) -> tuple[bool, str | None]:
@@ -550,8 +723,8 @@ class ProcessosWidget(QWidget):
         if not data_entrada or not data_processo:
             return True, None
         try:
-            dt_entrada = datetime.strptime(data_entrada, "%Y-%m-%d").date()
-            dt_processo = datetime.strptime(data_processo, "%Y-%m-%d").date()
+            dt_entrada = date.fromisoformat(data_entrada)
+            dt_processo = date.fromisoformat(data_processo)
             if dt_entrada > dt_processo:
                 return (
                     False,
@@ -570,80 +743,63 @@ class ProcessosWidget(QWidget):
         cliente: str,
         pedido: str,
         data_entrada: str,
+        *,
+        rolar_para_ultimo: bool = False,
     ) -> None:
-        """Ajusta o filtro de período se necessário para o registro."""
-        if not self.periodo_controller:
-            return
+        """Seleciona o período do registro e reaplica o filtro.
 
-        periodo_selecionado_inicio, periodo_selecionado_fim = (
-            self.periodo_controller.obter_periodo_selecionado()
-        )
-        filtro_no_periodo_registro = (
-            periodo_selecionado_inicio == periodo_inicio.strftime("%Y-%m-%d")
-            and periodo_selecionado_fim == periodo_fim.strftime("%Y-%m-%d")
-        )
-
-        if not filtro_no_periodo_registro:
+        Chamado quando o período selecionado difere do período do registro.
+        Sempre termina com :meth:`_reaplicar_filtro`, então o chamador não
+        deve reaplicá-lo de novo.
+        """
+        controller = self.periodo_controller
+        if controller:
             # Garantir que o ano esteja disponível
             ano_periodo = str(periodo_inicio.year)
-            combo_ano = self.periodo_controller.combo_ano
-            if ano_periodo not in [
-                combo_ano.itemText(i) for i in range(combo_ano.count())
-            ]:
-                combo_ano.addItem(ano_periodo)
-                # Ordenar os anos
-                anos = []
-                for i in range(1, combo_ano.count()):
-                    anos.append(combo_ano.itemText(i))
-                anos.sort(reverse=True)
-                combo_ano.clear()
-                combo_ano.addItem("Todos os anos")
-                for ano in anos:
-                    combo_ano.addItem(ano)
-
-            controller = self.periodo_controller
+            combo_ano = controller.combo_ano
+            anos = {combo_ano.itemText(i) for i in range(1, combo_ano.count())}
+            if ano_periodo not in anos:
+                anos.add(ano_periodo)
+                # Reconstrói o combo já ordenado, sem sinais intermediários
+                with QSignalBlocker(combo_ano):
+                    combo_ano.clear()
+                    combo_ano.addItem("Todos os anos")
+                    combo_ano.addItems(sorted(anos, reverse=True))
+
             controller.selecionar_ano(ano_periodo)
-            controller.atualizar_periodos()
+            # atualizar_periodos não bloqueia os sinais do combo; o filtro é
+            # reaplicado uma única vez ao final deste método
+            with QSignalBlocker(controller.combo_periodo):
+                controller.atualizar_periodos()
 
             # Selecionar o período
-            periodo_display = (
-                f"{periodo_inicio.strftime('%d/%m')} a {periodo_fim.strftime('%d/%m')}"
-            )
+            periodo_display = _texto_periodo(periodo_inicio, periodo_fim)
             controller.selecionar_periodo_por_datas(periodo_display)
 
-            # Destacar o item
-            QTimer.singleShot(
-                100,
-                lambda: self.selecionar_registro_recente(
-                    cliente, pedido, data_entrada),
-            )
+            # Destacar o item assim que a tabela for repopulada
+            self._registro_para_selecionar = (cliente, pedido, data_entrada)
+
+        self._reaplicar_filtro(rolar_para_ultimo=rolar_para_ultimo)
 
     def _calcular_usuario_filtro(self):
         """Determina o filtro de usuário considerando admin/usuário."""
         if self.is_admin:
-            if (
-                hasattr(self, "combo_usuario")
-                and self.combo_usuario.currentText() != "Todos os usuários"
-            ):
-                return self.combo_usuario.currentText()
-            return None
+            if self.combo_usuario is None:
+                return None
+            usuario = self.combo_usuario.currentText()
+            return usuario if usuario != "Todos os usuários" else None
         return self.usuario_logado
 
     def _obter_filtros_texto(self):
         """Obtém filtros de cliente e pedido a partir dos campos de texto."""
+        # Cada campo é lido uma única vez: text() cruza a fronteira Python/Qt
         cliente_filtro = None
-        if (
-            hasattr(self, "entry_filtro_cliente")
-            and self.entry_filtro_cliente.text().strip()
-        ):
-            cliente_filtro = self.entry_filtro_cliente.text().strip().upper()
+        if self.entry_filtro_cliente is not None:
+            cliente_filtro = self.entry_filtro_cliente.text().strip().upper() or None
 
         pedido_filtro = None
-        if (
-            hasattr(self, "entry_filtro_pedido")
-            and self.entry_filtro_pedido.text().strip()
-        ):
-            pedido_filtro = self.entry_filtro_pedido.text().strip()
+        if self.entry_filtro_pedido is not None:
+            pedido_filtro = self.entry_filtro_pedido.text().strip() or None
 
         return cliente_filtro, pedido_filtro
 
@@ -653,39 +809,103 @@ class ProcessosWidget(QWidget):
             return None, None
         return self.periodo_controller.obter_periodo_selecionado()
 
-    def aplicar_filtro(self, rolar_para_ultimo=True):
-        """Aplica filtros e preenche a tabela."""
-        usuario_filtro = self._calcular_usuario_filtro()
+    def agendar_filtro(self, rolar_para_ultimo=False):
+        """Agenda a aplicação dos filtros, agrupando chamadas em sequência."""
+        self._rolar_filtro_pendente = self._rolar_filtro_pendente or rolar_para_ultimo
+        self._timer_filtro.start()
+
+    def _executar_filtro_agendado(self):
+        """Aplica o filtro pendente quando o timer de agrupamento expira."""
+        self.aplicar_filtro(rolar_para_ultimo=self._rolar_filtro_pendente)
+
+    def _reaplicar_filtro(self, rolar_para_ultimo=False):
+        """Refaz a consulta mesmo com filtros iguais (dados foram alterados)."""
+        self._ultimos_filtros_solicitados = None
+        self.aplicar_filtro(rolar_para_ultimo=rolar_para_ultimo)
+
+    def _montar_filtros(self) -> dict:
+        """Reúne os filtros atuais da interface no formato do serviço de dados."""
         cliente_filtro, pedido_filtro = self._obter_filtros_texto()
         data_inicio, data_fim = self._obter_periodo_selecionado()
+        return {
+            "usuario": self._calcular_usuario_filtro(),
+            "cliente": cliente_filtro,
+            "pedido": pedido_filtro,
+            "data_inicio": data_inicio,
+            "data_fim": data_fim,
+        }
 
-        registros_ordenados = data.buscar_registros_filtrados(
-            usuario=usuario_filtro,
-            cliente=cliente_filtro,
-            pedido=pedido_filtro,
-            data_inicio=data_inicio,
-            data_fim=data_fim,
+    def aplicar_filtro(self, rolar_para_ultimo=True):
+        """Aplica filtros e preenche a tabela."""
+        # Uma aplicação direta atende também qualquer pedido ainda agendado
+        self._timer_filtro.stop()
+        rolar_para_ultimo = rolar_para_ultimo or self._rolar_filtro_pendente
+        self._rolar_filtro_pendente = False
+
+        filtros = self._montar_filtros()
+        if not rolar_para_ultimo and filtros == self._ultimos_filtros_solicitados:
+            # Nada mudou desde a última consulta enviada (ex.: texto digitado
+            # e apagado, foco que entra e sai do campo)
+            return
+        self._ultimos_filtros_solicitados = filtros
+
+        # A consulta roda no pool de threads; apenas o resultado do pedido
+        # mais recente é aplicado à tabela.
+        self._filtro_req_id += 1
+        com_totais = self._totais_visiveis()
+        workers.executar_em_segundo_plano(
+            data.buscar_registros_com_estatisticas
+            if com_totais
+            else data.buscar_registros_filtrados,
+            ao_concluir=self._on_filtro_concluido,
+            ao_falhar=self._on_filtro_falhou,
+            contexto=(self._filtro_req_id, filtros,
+                      rolar_para_ultimo, com_totais),
+            **filtros,
         )
 
-        table.preencher_tabela(
+    def _on_filtro_falhou(self, contexto, erro):
+        """Libera o filtro para nova tentativa e informa a falha na consulta."""
+        if contexto[0] != self._filtro_req_id:
+            return  # Falha de um filtro já substituído por outro mais novo
+        # Sem isso a deduplicação de aplicar_filtro impediria repetir a consulta
+        self._ultimos_filtros_solicitados = None
+        self._registro_para_selecionar = None
+        QMessageBox.warning(self, "Erro", f"Erro ao carregar pedidos: {erro}")
+
+    def _on_filtro_concluido(self, contexto, resultado):
+        """Preenche a tabela e os totais com o resultado em segundo plano."""
+        req_id, filtros, rolar_para_ultimo, com_totais = contexto
+        if req_id != self._filtro_req_id:
+            return  # Resultado obsoleto: um filtro mais novo já foi disparado
+        if com_totais:
+            registros_ordenados, estatisticas = resultado
+        else:
+            registros_ordenados, estatisticas = resultado, None
+
+        self._indice_linhas = table.preencher_tabela(
             tabela=self.tabela,
             registros=registros_ordenados,
             is_admin=self.is_admin,
         )
+        self._registros_exibidos = registros_ordenados
+        self._filtros_exibidos = filtros
 
-        filtros = {
-            "usuario": usuario_filtro,
-            "cliente": cliente_filtro,
-            "pedido": pedido_filtro,
-            "data_inicio": data_inicio,
-            "data_fim": data_fim,
-        }
-
-        self.atualizar_totais(filtros)
+        if estatisticas is None:
+            # O painel pode ter sido exibido enquanto a consulta rodava:
+            # atualizar_totais calcula agora ou marca como pendente.
+            self.atualizar_totais(filtros, registros_ordenados)
+        else:
+            self._exibir_estatisticas(estatisticas)
 
         if rolar_para_ultimo:
             self.rolar_para_ultimo_item()
 
+        if self._registro_para_selecionar is not None:
+            cliente, pedido, data_entrada = self._registro_para_selecionar
+            self._registro_para_selecionar = None
+            self.selecionar_registro_recente(cliente, pedido, data_entrada)
+
     def limpar_formulario(self):
         """Limpa todos os campos do formulário de entrada."""
         self.entry_cliente.clear()
@@ -711,34 +931,75 @@ class ProcessosWidget(QWidget):
 
         Based on the provided data.
         """
-        offset = 1 if self.is_admin else 0
-        data_entrada_formatada = formatar_data_para_exibicao(data_entrada)
-
-        for row in range(self.tabela.rowCount()):
-            # Verificar se os dados da linha correspondem ao registro recém-adicionado
-            cliente_tabela = self.tabela.item(row, offset).text()
-            pedido_tabela = self.tabela.item(row, 1 + offset).text()
-            data_entrada_tabela = self.tabela.item(row, 3 + offset).text()
-
-            if (
-                cliente_tabela.upper() == cliente.upper()
-                and pedido_tabela == pedido
-                and data_entrada_tabela == data_entrada_formatada
-            ):
-                # Encontrou o registro, selecionar e rolar para ele
-                self.tabela.selectRow(row)
-                self.tabela.setCurrentCell(row, offset)
-                self.tabela.scrollToItem(self.tabela.item(row, offset))
-                self.tabela.setFocus()
-                break
+        offset = self._col_offset
+        chave = (cliente.upper(), pedido, formatar_data_para_exibicao(data_entrada))
+
+        # O índice montado no preenchimento pode estar defasado (ordenação
+        # pelo cabeçalho, linhas removidas): confirma a linha antes de usar.
+        row = self._indice_linhas.get(chave)
+        if row is None or not self._linha_corresponde(row, offset, chave):
+            # findItems percorre a tabela em C++; o pedido é o campo mais
+            # seletivo e só as poucas linhas candidatas são conferidas.
+            col_pedido = offset + Coluna.PEDIDO
+            row = next(
+                (
+                    item.row()
+                    for item in self.tabela.findItems(
+                        pedido, Qt.MatchFlag.MatchExactly)
+                    if item.column() == col_pedido
+                    and self._linha_corresponde(item.row(), offset, chave)
+                ),
+                None,
+            )
+        if row is None:
+            return
+
+        # Encontrou o registro, selecionar e rolar para ele
+        self.tabela.selectRow(row)
+        self.tabela.setCurrentCell(row, offset + Coluna.CLIENTE)
+        self.tabela.scrollToItem(self.tabela.item(row, offset + Coluna.CLIENTE))
+        self.tabela.setFocus()
+
+    def _linha_corresponde(self, row: int, offset: int, chave) -> bool:
+        """Verifica se a linha exibe o cliente, pedido e data de entrada da chave."""
+        cliente, pedido, data_entrada_formatada = chave
+        item_cliente = self.tabela.item(row, offset + Coluna.CLIENTE)
+        item_pedido = self.tabela.item(row, offset + Coluna.PEDIDO)
+        item_data = self.tabela.item(row, offset + Coluna.DATA_ENTRADA)
+        if item_cliente is None or item_pedido is None or item_data is None:
+            return False
+        return (
+            item_cliente.text().upper() == cliente
+            and item_pedido.text() == pedido
+            and item_data.text() == data_entrada_formatada
+        )
 
-    def atualizar_totais(self, filtros: dict | None = None):
-        """Atualiza os totalizadores do painel."""
+    def atualizar_totais(self, filtros: dict | None = None, registros=None):
+        """Atualiza os totalizadores do painel.
+
+        Se ``registros`` for informado, os totais são derivados dele em vez
+        de consultar o banco novamente.
+        """
         if not self.controles_totais:
             return
+        if not self._totais_visiveis():
+            # Recalculados no próximo showEvent
+            self._totais_pendentes = True
+            return
 
         filtros = filtros or {}
-        estatisticas = data.obter_estatisticas_totais(filtros)
+        self._exibir_estatisticas(
+            data.obter_estatisticas_totais(filtros, registros))
+
+    def _totais_visiveis(self) -> bool:
+        """Indica se o painel de totais está visível para o usuário."""
+        return self.frame_totais is not None and self.frame_totais.isVisible()
+
+    def _exibir_estatisticas(self, estatisticas):
+        """Exibe no painel de totais as estatísticas já calculadas."""
+        if not self.controles_totais:
+            return
+        self._totais_pendentes = False
 
         # pylint: disable=unexpected-keyword-arg,no-member
         totais.atualizar_totais(
@@ -760,16 +1021,29 @@ class ProcessosWidget(QWidget):
 
     def adicionar_pedido(self):
         """Valida campos e insere novo pedido no banco."""
+        if self._salvando_pedido:
+            return
+
         form_data = {
-            "cliente": normalizar_nome_cliente(self.entry_cliente.text()),
-            "pedido": self.entry_pedido.text().strip(),
-            "qtde_itens": self.entry_qtde_itens.text().strip(),
-            "valor_pedido": self.entry_valor_pedido.text().strip(),
-            "tempo_corte": self.entry_tempo_corte.text().strip(),
+            campo: getattr(self, atributo).text().strip()
+            for campo, atributo in _CAMPOS_FORM
         }
+        form_data["cliente"] = normalizar_nome_cliente(form_data["cliente"])
 
+        # Campos vazios são recusados aqui, sem ida ao banco
+        if self._focar_campo_obrigatorio_vazio():
+            QMessageBox.warning(
+                self,
+                "Erro",
+                "Erro: Campos obrigatórios: usuário, cliente, pedido, "
+                "qtd itens, data entrada, valor.",
+            )
+            return
+
+        # Uma única leitura da data atual: as duas comparações usam o mesmo dia
+        hoje = obter_data_atual_utc()
         data_entrada_qdate = self.entry_data_entrada.date()
-        if data_entrada_qdate > obter_data_atual_utc():
+        if data_entrada_qdate > hoje:
             QMessageBox.warning(
                 self, "Erro", "Data de entrada não pode ser maior que a data atual."
             )
@@ -778,7 +1052,7 @@ class ProcessosWidget(QWidget):
 
         data_processo_qdate = self.entry_data_processo.date()
         if not data_processo_qdate.isNull():
-            if data_processo_qdate > obter_data_atual_utc():
+            if data_processo_qdate > hoje:
                 QMessageBox.warning(
                     self,
                     "Erro",
@@ -796,11 +1070,16 @@ class ProcessosWidget(QWidget):
         else:
             data_processo = ""
 
-        # Capturar anos disponíveis antes da adição
+        # Garante os anos conhecidos antes da adição (normalmente sem consulta)
         usuario_filtro = self._calcular_usuario_filtro()
-        anos_antes = set(data.listar_anos_disponiveis(usuario_filtro))
-
-        resultado = db.adicionar_lancamento(
+        self._obter_anos_disponiveis(usuario_filtro)
+
+        # A gravação roda no pool de threads; o formulário fica desabilitado
+        # até o retorno para impedir inserções duplicadas e para que a limpeza
+        # após o sucesso não apague o que fosse digitado nesse intervalo.
+        self._definir_salvando_pedido(True)
+        workers.executar_em_segundo_plano(
+            db.adicionar_lancamento,
             usuario=self.usuario_logado,
             cliente=form_data["cliente"],
             pedido=form_data["pedido"],
@@ -809,60 +1088,133 @@ class ProcessosWidget(QWidget):
             data_processo=data_processo,
             valor_pedido=form_data["valor_pedido"],
             tempo_corte=form_data["tempo_corte"],
+            ao_concluir=self._on_pedido_adicionado,
+            ao_falhar=self._on_falha_adicionar_pedido,
+            contexto=(form_data, data_entrada, data_processo, usuario_filtro),
         )
 
+    def _mostrar_sucesso(self, mensagem: str) -> None:
+        """Mostra a confirmação na barra de status, sem diálogo modal.
+
+        Fora de uma ``QMainWindow`` (ex.: widget isolado) mantém a caixa de
+        mensagem; falhas continuam usando ``QMessageBox.warning``.
+        """
+        janela = self.window()
+        if isinstance(janela, QMainWindow):
+            janela.statusBar().showMessage(mensagem, 2500)
+        else:
+            QMessageBox.information(self, "Sucesso", mensagem)
+
+    def _obter_anos_disponiveis(self, usuario_filtro) -> set[str]:
+        """Retorna os anos do filtro, consultando apenas na primeira vez."""
+        if self._anos_disponiveis_cache is None:
+            self._anos_disponiveis_cache = set(
+                data.listar_anos_disponiveis(usuario_filtro)
+            )
+        return self._anos_disponiveis_cache
+
+    def _registrar_ano_processo(self, data_processo, usuario_filtro) -> bool:
+        """Registra o ano do lançamento inserido e indica se ele é novo.
+
+        Os anos do filtro vêm das datas de processo, então registros sem data
+        de processo ou de outro usuário não alteram a lista exibida.
+        """
+        if not data_processo or usuario_filtro not in (None, self.usuario_logado):
+            return False
+        anos = self._obter_anos_disponiveis(usuario_filtro)
+        ano_novo = data_processo[:4]
+        if ano_novo in anos:
+            return False
+        anos.add(ano_novo)
+        return True
+
+    def _definir_salvando_pedido(self, salvando: bool) -> None:
+        """Marca a gravação em andamento e bloqueia o formulário enquanto dura."""
+        self._salvando_pedido = salvando
+        self.frame_entrada.setEnabled(not salvando)
+
+    def _on_falha_adicionar_pedido(self, _contexto, erro):
+        """Reabilita o formulário e informa a falha inesperada na gravação."""
+        self._definir_salvando_pedido(False)
+        QMessageBox.warning(self, "Erro", f"Erro ao adicionar pedido: {erro}")
+
+    def _on_pedido_adicionado(self, contexto, resultado):
+        """Conclui a inserção iniciada por :meth:`adicionar_pedido`."""
+        form_data, data_entrada, data_processo, usuario_filtro = contexto
+        self._definir_salvando_pedido(False)
+
         if "Sucesso" in resultado:
-            QMessageBox.information(self, "Sucesso", resultado)
+            data.invalidar_cache()
+            self._mostrar_sucesso(resultado)
             self.limpar_formulario()
 
-            self.autocomplete_manager.refresh_all()
+            self._timer_autocomplete.start()
 
-            # Verificar se novos anos foram criados e recarregar filtros se necessário
-            anos_depois = set(data.listar_anos_disponiveis(usuario_filtro))
-            novos_anos_criados = anos_depois != anos_antes
-
-            if novos_anos_criados:
+            # Recarregar filtros apenas se o registro criou um ano novo
+            if self._registrar_ano_processo(data_processo, usuario_filtro):
                 self.configurar_filtros_ano_periodo()
 
-            # Selecionar automaticamente o período correspondente ao novo registro
-            # Usar data de processo se disponível, senão usar data de entrada
-            data_registro = datetime.strptime(
-                data_processo if data_processo else data_entrada, "%Y-%m-%d"
-            )
-            periodo_inicio, periodo_fim = calcular_periodo_faturamento_para_data_datas(
-                data_registro
-            )
-
-            # Verificar se o filtro já está no período do registro
-            periodo_selecionado_inicio, periodo_selecionado_fim = (
-                self.periodo_controller.obter_periodo_selecionado()
-                if self.periodo_controller
-                else (None, None)
-            )
-            filtro_no_periodo_registro = (
-                periodo_selecionado_inicio == periodo_inicio.strftime(
-                    "%Y-%m-%d")
-                and periodo_selecionado_fim == periodo_fim.strftime("%Y-%m-%d")
-            )
+            # Selecionar automaticamente o período correspondente ao novo
+            # registro; sem controle de período não há seleção a ajustar
+            filtro_no_periodo_registro = True
+            if self.periodo_controller is not None:
+                # Usar data de processo se disponível, senão data de entrada
+                data_registro = date.fromisoformat(data_processo or data_entrada)
+                periodo_inicio, periodo_fim = (
+                    calcular_periodo_faturamento_para_data_datas(data_registro)
+                )
+                filtro_no_periodo_registro = (
+                    self.periodo_controller.obter_periodo_selecionado()
+                    == _limites_iso(periodo_inicio, periodo_fim)
+                )
 
-            if not filtro_no_periodo_registro:
+            # Uma única recarga da tabela: o ajuste de período já reaplica
+            # o filtro por conta própria
+            if filtro_no_periodo_registro:
+                self._reaplicar_filtro(rolar_para_ultimo=True)
+            else:
                 self._ajustar_periodo_para_registro(
                     periodo_inicio,
                     periodo_fim,
                     form_data["cliente"],
                     form_data["pedido"],
                     data_entrada,
+                    rolar_para_ultimo=True,
                 )
-
-            self.aplicar_filtro()
             self.entry_cliente.setFocus()
         else:
             QMessageBox.warning(self, "Erro", resultado)
 
+    def _remover_linha_excluida(self, row: int, registro_id) -> None:
+        """Remove da tabela e dos totais o registro excluído, sem reconsultar."""
+        col_id = self._col_offset + Coluna.CLIENTE
+        item_id = self.tabela.item(row, col_id)
+        if (
+            self._registros_exibidos is None
+            or item_id is None
+            or item_id.data(Qt.UserRole) != registro_id
+        ):
+            # A tabela mudou enquanto a confirmação estava aberta
+            self._reaplicar_filtro()
+            return
+
+        # A repopulação completa já suspende sinais e pintura em
+        # preencher_tabela; aqui basta isolar a remoção de itemChanged.
+        with QSignalBlocker(self.tabela):
+            self.tabela.removeRow(row)
+        self._registros_exibidos = [
+            registro
+            for registro in self._registros_exibidos
+            if registro[0] != registro_id
+        ]
+        self.atualizar_totais(self._filtros_exibidos, self._registros_exibidos)
+
     def excluir_pedido(self):
         """Exclui o pedido selecionado na tabela."""
-        row = self.tabela.currentRow()
-        if row < 0:
+        if self._excluindo_pedido:
+            return
+        indice_atual = self.tabela.currentIndex()
+        if not indice_atual.isValid():
             QMessageBox.information(
                 self,
                 "Seleção",
@@ -874,12 +1226,17 @@ class ProcessosWidget(QWidget):
             )
             return
 
-        if not self.is_admin:
-            cliente = self.tabela.item(row, 0).text()
-            pedido = self.tabela.item(row, 1).text()
-        else:
-            cliente = self.tabela.item(row, 1).text()
-            pedido = self.tabela.item(row, 2).text()
+        row = indice_atual.row()
+        # O id fica no item do cliente; o deslocamento cobre a coluna de admin.
+        # Tudo é copiado para valores Python antes do diálogo: o laço de
+        # eventos dele pode repopular a tabela e destruir os itens.
+        item_com_id = self.tabela.item(row, self._col_offset + Coluna.CLIENTE)
+        item_pedido = self.tabela.item(row, self._col_offset + Coluna.PEDIDO)
+        if item_com_id is None or item_pedido is None:
+            return
+        registro_id = item_com_id.data(Qt.UserRole)
+        cliente = item_com_id.text()
+        pedido = item_pedido.text()
 
         resposta = QMessageBox.question(
             self,
@@ -891,19 +1248,38 @@ class ProcessosWidget(QWidget):
             QMessageBox.Yes | QMessageBox.No,
         )
 
-        if resposta == QMessageBox.Yes:
-            if not self.is_admin:
-                item_com_id = self.tabela.item(row, 0)
-            else:
-                item_com_id = self.tabela.item(row, 1)
-
-            if item_com_id:
-                registro_id = item_com_id.data(Qt.UserRole)
-                resultado = db.excluir_lancamento(registro_id)
-                if "Sucesso" in resultado:
-                    QMessageBox.information(self, "Sucesso", resultado)
-                    # Removido: self.configurar_filtros_ano_periodo() - não é necessário
-                    # recarregar filtros após excluir um registro
-                    self.aplicar_filtro(rolar_para_ultimo=False)
-                else:
-                    QMessageBox.warning(self, "Erro", resultado)
+        if resposta != QMessageBox.Yes:
+            return
+
+        self._excluindo_pedido = True
+        self.btn_excluir.setEnabled(False)
+        workers.executar_em_segundo_plano(
+            db.excluir_lancamento,
+            registro_id,
+            ao_concluir=self._on_pedido_excluido,
+            ao_falhar=self._on_falha_excluir_pedido,
+            contexto=(row, registro_id),
+        )
+
+    def _on_falha_excluir_pedido(self, _contexto, erro):
+        """Reabilita a exclusão e informa a falha inesperada no banco."""
+        self._excluindo_pedido = False
+        self.btn_excluir.setEnabled(True)
+        QMessageBox.warning(self, "Erro", f"Erro ao excluir pedido: {erro}")
+
+    def _on_pedido_excluido(self, contexto, resultado):
+        """Conclui a exclusão iniciada por :meth:`excluir_pedido`."""
+        row, registro_id = contexto
+        self._excluindo_pedido = False
+        self.btn_excluir.setEnabled(True)
+
+        if "Sucesso" in resultado:
+            data.invalidar_cache()
+            # A exclusão pode ter esvaziado um ano: recarrega na próxima inserção
+            self._anos_disponiveis_cache = None
+            self._mostrar_sucesso(resultado)
+            # Removido: self.configurar_filtros_ano_periodo() - não é necessário
+            # recarregar filtros após excluir um registro
+            self._remover_linha_excluida(row, registro_id)
+        else:
+            QMessageBox.warning(self, "Erro", resultado)